@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the ZX kernels
+
+Compiles the integer phase and validation kernels from _zx_numba into
+the extension module `sccmu_ui/_zx_compiled` with numba.pycc, so
+short runs (e.g. the test suite) skip numba import and JIT start-up.
+
+Build with: python3 -m sccmu_ui._zx_aot
+Requires numba at build time only; the built module needs just NumPy.
+Rebuild after changing the kernels in _zx_numba.py.
+"""
+
+import os
+
+# Compile from the JIT definitions, not a previously built module
+os.environ['ZX_NO_AOT'] = '1'
+
+from numba.pycc import CC
+
+from . import _zx_numba
+
+cc = CC('_zx_compiled')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('normalize_phase', 'UniTuple(i8, 2)(i8, i8)')(
+    _zx_numba.normalize_phase_kernel.py_func
+)
+cc.export('add_phases', 'UniTuple(i8, 2)(i8, i8, i8, i8)')(
+    _zx_numba.add_phases_kernel.py_func
+)
+cc.export('validate_soa', 'UniTuple(i8, 2)(i4[:], i4[:], i4[:], i1[:], i4[:])')(
+    _zx_numba._validate_soa_loop.py_func
+)
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+JIT-compiled ZX phase kernels
+
+Integer-only Qπ phase arithmetic shared by zx_core and coherence.
+Phases are compared by cross-multiplication (n₁d₂ vs n₂d₁), so no
+float conversion or tolerance is needed.
+
+Numba is optional: without it the kernels run as plain Python/NumPy.
+If the ahead-of-time module `_zx_compiled` has been built
+(`python -m sccmu_ui._zx_aot`), its kernels are used and numba is not
+imported at all, so there is no JIT start-up cost. Set ZX_NO_AOT=1 to
+ignore the prebuilt module.
+"""
+
+import os
+import numpy as np
+
+HAVE_AOT = False
+if os.environ.get('ZX_NO_AOT', '0') != '1':
+    try:
+        from . import _zx_compiled
+        HAVE_AOT = True
+    except ImportError:
+        # Prebuilt kernels are optional
+        pass
+
+HAVE_NUMBA = False
+if not HAVE_AOT:
+    try:
+        from numba import njit, int8, int32, int64, types
+        HAVE_NUMBA = True
+    except ImportError:
+        # Numba is optional
+        pass
+
+if not HAVE_NUMBA:
+    int64 = None
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Explicit signature avoids per-call type inference
+_PHASE_SIG = types.UniTuple(int64, 2)(int64, int64) if HAVE_NUMBA else None
+_ADD_SIG = types.UniTuple(int64, 2)(int64, int64, int64, int64) if HAVE_NUMBA else None
+
+
+@njit(_PHASE_SIG, cache=True)
+def normalize_phase_kernel(phase_numer, phase_denom):
+    """
+    Reduce n/d (units of π) to [0, 2π) in lowest terms.
+    
+    Returns the pair (n, d). Euclid's loop replaces math.gcd so the
+    kernel compiles without Python objects.
+    """
+    mod = 2 * phase_denom
+    numer_mod = phase_numer % mod
+    
+    a = numer_mod
+    b = phase_denom
+    while b:
+        a, b = b, a % b
+    
+    return numer_mod // a, phase_denom // a
+
+
+@njit(_ADD_SIG, cache=True)
+def add_phases_kernel(phase1_n, phase1_d, phase2_n, phase2_d):
+    """
+    Add two Qπ phases, returning the reduced pair (n, d).
+    
+    Denominators are powers of 2: the LCM is the larger one, the other
+    numerator is aligned by shifting, the mod-2π reduction is a mask
+    and the gcd is the shared run of trailing zeros. Shifts only, no
+    integer division.
+    """
+    common_denom = max(phase1_d, phase2_d)
+    while phase1_d < common_denom:
+        phase1_n <<= 1
+        phase1_d <<= 1
+    while phase2_d < common_denom:
+        phase2_n <<= 1
+        phase2_d <<= 1
+    
+    numer = (phase1_n + phase2_n) & (2 * common_denom - 1)
+    while common_denom > 1 and (numer & 1) == 0:
+        numer >>= 1
+        common_denom >>= 1
+    return numer, common_denom
+
+
+# validate_soa result codes: (code, offending value)
+VALID = 0
+SELF_LOOP = 1
+UNKNOWN_NODE = 2
+BAD_KIND = 3
+BAD_DENOM = 4
+
+_VALIDATE_SIG = (types.UniTuple(int64, 2)(int32[:], int32[:], int32[:], int8[:], int32[:])
+                 if HAVE_NUMBA else None)
+
+
+@njit(cache=True)
+def _contains_sorted(sorted_ids, value):
+    """Binary search membership test on an ascending array"""
+    lo = 0
+    hi = sorted_ids.shape[0]
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if sorted_ids[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo < sorted_ids.shape[0] and sorted_ids[lo] == value
+
+
+@njit(_VALIDATE_SIG, cache=True)
+def _validate_soa_loop(sorted_ids, edge_src, edge_dst, kinds, denoms):
+    """Single pass over edges then labels; stops at the first failure"""
+    # Dense IDs (the usual case): O(1) membership via a mask indexed by
+    # ID; sparse IDs fall back to binary search
+    n = sorted_ids.shape[0]
+    lo_id = sorted_ids[0] if n else 0
+    span = sorted_ids[n - 1] - lo_id + 1 if n else 0
+    dense = span <= 4 * n + 1024
+    mask = np.zeros(span if dense else 0, dtype=np.bool_)
+    if dense:
+        for i in range(n):
+            mask[sorted_ids[i] - lo_id] = True
+    
+    for i in range(edge_src.shape[0]):
+        u = edge_src[i]
+        v = edge_dst[i]
+        if u == v:
+            return SELF_LOOP, u
+        for w in (u, v):
+            if dense:
+                known = 0 <= w - lo_id < span and mask[w - lo_id]
+            else:
+                known = _contains_sorted(sorted_ids, w)
+            if not known:
+                return UNKNOWN_NODE, w
+    for i in range(kinds.shape[0]):
+        if kinds[i] != 0 and kinds[i] != 1:
+            return BAD_KIND, kinds[i]
+        d = denoms[i]
+        if d <= 0 or (d & (d - 1)) != 0:
+            return BAD_DENOM, d
+    return VALID, 0
+
+
+def _validate_soa_numpy(sorted_ids, edge_src, edge_dst, kinds, denoms):
+    """Vectorized equivalent of _validate_soa_loop (used without numba)"""
+    loops = edge_src == edge_dst
+    known_src = np.isin(edge_src, sorted_ids, assume_unique=False)
+    known_dst = np.isin(edge_dst, sorted_ids, assume_unique=False)
+    bad_edge = loops | ~known_src | ~known_dst
+    if bad_edge.any():
+        i = np.argmax(bad_edge)
+        if loops[i]:
+            return SELF_LOOP, int(edge_src[i])
+        return UNKNOWN_NODE, int(edge_dst[i] if known_src[i] else edge_src[i])
+    
+    bad_kind = (kinds != 0) & (kinds != 1)
+    bad_denom = (denoms <= 0) | ((denoms & (denoms - 1)) != 0)
+    bad_label = bad_kind | bad_denom
+    if bad_label.any():
+        i = np.argmax(bad_label)
+        if bad_kind[i]:
+            return BAD_KIND, int(kinds[i])
+        return BAD_DENOM, int(denoms[i])
+    return VALID, 0
+
+
+def validate_soa(sorted_ids, edge_src, edge_dst, kinds, denoms):
+    """
+    Check edges and labels of a graph's SoA view.
+    
+    sorted_ids: int32 node IDs in ascending order
+    edge_src, edge_dst: int32 edge endpoints
+    kinds: int8 spider codes; denoms: int32 phase denominators
+    
+    Returns (code, value) where value is the offending node ID, kind
+    code or denominator. Numba compiles an explicit loop that stops
+    at the first failure; without it the same checks run vectorized.
+    """
+    if HAVE_AOT:
+        return _zx_compiled.validate_soa(sorted_ids, edge_src, edge_dst, kinds, denoms)
+    if HAVE_NUMBA:
+        return _validate_soa_loop(sorted_ids, edge_src, edge_dst, kinds, denoms)
+    return _validate_soa_numpy(sorted_ids, edge_src, edge_dst, kinds, denoms)
+
+
+@njit(cache=True)
+def phases_equal(n1, d1, n2, d2):
+    """Exact phase equality n₁/d₁ = n₂/d₂ (scalars or arrays)"""
+    return n1 * d2 == n2 * d1
+
+
+@njit(cache=True)
+def phase_distance(n1, d1, n2, d2):
+    """
+    Scaled phase distance |n₁d₂ - n₂d₁|.
+
+    Equals |n₁/d₁ - n₂/d₂| · d₁d₂ (in units of π).
+    """
+    return np.abs(n1 * d2 - n2 * d1)
+
+
+if HAVE_AOT:
+    normalize_phase_kernel = _zx_compiled.normalize_phase
+    add_phases_kernel = _zx_compiled.add_phases
@@ -15,7 +15,7 @@ Test with: python3 -m pytest sccmu_ui/test_clifford_mapping.py
 
 import numpy as np
 from typing import Dict, List, Tuple
-from .zx_core import ZXGraph, PHI
+from .zx_core import ZXGraph, PHI, KIND_Z
 
 
 def zx_to_clifford(graph: ZXGraph) -> np.ndarray:
@@ -39,100 +39,103 @@ def zx_to_clifford(graph: ZXGraph) -> np.ndarray:
             [15]: Pseudoscalar e₀₁₂₃ (grade-4)
     """
     graph.validate()
+    return zx_to_clifford_soa(graph.soa)
+
+
+def zx_to_clifford_soa(soa: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    zx_to_clifford on a graph's struct-of-arrays view (ZXGraph.soa).
+    
+    Every grade is accumulated with vector ops over all spiders/edges
+    instead of per-node Python loops. The graph must be valid (every
+    node labelled, edges between known nodes).
     
+    Returns:
+        components[16] as in zx_to_clifford
+    """
     components = np.zeros(16)
     
-    if not graph.nodes:
+    num_nodes = soa['node_id'].shape[0]
+    if num_nodes == 0:
         return components
     
-    # Build adjacency for connectivity analysis
-    adjacency = build_adjacency(graph)
+    phases = soa['phase_rad']
+    is_z = soa['kind'] == KIND_Z
+    
+    # Edge endpoints as node positions
+    num_edges = soa['edge_src'].shape[0]
+    if num_edges > 0:
+        order = np.argsort(soa['node_id'], kind='stable')
+        sorted_ids = soa['node_id'][order]
+        src = order[np.searchsorted(sorted_ids, soa['edge_src'])]
+        dst = order[np.searchsorted(sorted_ids, soa['edge_dst'])]
+        
+        # Degree counts each edge at both endpoints (as build_adjacency does)
+        degree = np.bincount(np.concatenate((src, dst)), minlength=num_nodes)
+    else:
+        degree = np.zeros(num_nodes)
     
     # === GRADE-0 & GRADE-2: Z/X-spiders → Rotors ===
     # Theory.md Theorem 1.0.3.3:
     # Z(α) ↔ exp(-½α e₁e₂) = cos(α/2) - sin(α/2) e₁e₂
-    
-    for node_id, label in graph.labels.items():
-        phase = label.phase_radians
-        degree = len(adjacency.get(node_id, []))
-        weight = np.sqrt(1 + degree)  # Connectivity weight
-        
-        if label.kind == 'Z':
-            # Z-spider → scalar rotor
-            components[0] += weight * np.cos(phase / 2)      # Scalar
-            components[5] += weight * np.sin(phase / 2)      # e₀₁ bivector
+    # Z-spider → scalar rotor [0], e₀₁ [5]; X-spider → e₁₂ [8], e₁₃ [9]
+    weight = np.sqrt(1 + degree)  # Connectivity weight
+    weight_z = weight * is_z
+    weight_x = weight - weight_z
+    half = np.where(is_z, phases / 2, phases)
+    cos_half, sin_half = np.cos(half), np.sin(half)
+    components[0] = cos_half @ weight_z
+    components[5] = sin_half @ weight_z
+    components[8] = cos_half @ weight_x
+    components[9] = sin_half @ weight_x
+    
+    if num_edges > 0:
+        phase_u, phase_v = phases[src], phases[dst]
         
-        elif label.kind == 'X':
-            # X-spider → phase bivector (orthogonal plane)
-            components[8] += weight * np.cos(phase)          # e₁₂ bivector
-            components[9] += weight * np.sin(phase)          # e₁₃ bivector
-    
-    # === GRADE-1: Edge phase deltas → Vectors (gauge connection) ===
-    # Theory: Connection from rotor phase deltas
-    
-    for u, v in graph.edges:
-        label_u = graph.labels.get(u)
-        label_v = graph.labels.get(v)
+        # === GRADE-1: Edge phase deltas → Vectors (gauge connection) ===
+        # Theory: Connection from rotor phase deltas
+        phase_delta = phase_v - phase_u
+        connection_weight = np.sqrt((degree[src] + degree[dst]) / 2) / num_edges
         
-        if label_u and label_v:
-            phase_u = label_u.phase_radians
-            phase_v = label_v.phase_radians
-            phase_delta = phase_v - phase_u
-            
-            # Connection strength
-            deg_u = len(adjacency.get(u, []))
-            deg_v = len(adjacency.get(v, []))
-            connection_weight = np.sqrt((deg_u + deg_v) / 2) / max(len(graph.edges), 1)
-            
-            # Vector components from gauge connection
-            components[1] += connection_weight * np.cos(phase_delta)
-            components[2] += connection_weight * np.sin(phase_delta)
-            components[3] += connection_weight * np.cos(2 * phase_delta)
-            components[4] += connection_weight * np.sin(2 * phase_delta)
-    
-    # === GRADE-2: Mixed Z-X edges → Additional bivectors ===
-    
-    for u, v in graph.edges:
-        label_u = graph.labels.get(u)
-        label_v = graph.labels.get(v)
+        components[1] = np.cos(phase_delta) @ connection_weight
+        components[2] = np.sin(phase_delta) @ connection_weight
+        components[3] = np.cos(2 * phase_delta) @ connection_weight
+        components[4] = np.sin(2 * phase_delta) @ connection_weight
         
-        if label_u and label_v and label_u.kind != label_v.kind:
-            # Mixed edge (Z-X or X-Z)
-            phase_u = label_u.phase_radians
-            phase_v = label_v.phase_radians
-            edge_weight = 1.0 / np.sqrt(max(len(graph.edges), 1))
-            
-            components[6] += edge_weight * np.sin(phase_u - phase_v)  # e₀₂
-            components[7] += edge_weight * np.cos(phase_u + phase_v)  # e₀₃
-            components[10] += edge_weight * np.sin(phase_u + phase_v) # e₂₃
+        # === GRADE-2: Mixed Z-X edges → Additional bivectors ===
+        mixed = (is_z[src] != is_z[dst]) / np.sqrt(num_edges)
+        phase_sum = phase_u + phase_v
+        components[6] = np.sin(-phase_delta) @ mixed    # e₀₂
+        components[7] = np.cos(phase_sum) @ mixed       # e₀₃
+        components[10] = np.sin(phase_sum) @ mixed      # e₂₃
     
     # === GRADE-3: Sovereign triads → Trivectors ===
     # Theory: Self-referential structure Ψ ≅ Hom(Ψ,Ψ)
+    if num_edges >= 3:
+        triads = _triangles_from_edges(src, dst, num_nodes)
+    else:
+        triads = np.empty((0, 3), dtype=np.intp)
     
-    triads = detect_triangles(graph, adjacency)
-    
-    if triads:
-        sovereignty_index = compute_sovereignty_from_triads(triads, graph)
-        trivector_strength = sovereignty_index * np.sqrt(len(triads)) / max(len(graph.nodes), 1)
+    if triads.shape[0] > 0:
+        triad_phases = phases[triads]
+        
+        # Sovereignty index: mean phase alignment exp(-Var) over triads
+        sovereignty_index = np.exp(-triad_phases.var(axis=1)).mean()
+        trivector_strength = sovereignty_index * np.sqrt(triads.shape[0]) / num_nodes
         
-        for triad in triads:
-            a, b, c = triad
-            phase_a = graph.labels[a].phase_radians
-            phase_b = graph.labels[b].phase_radians
-            phase_c = graph.labels[c].phase_radians
-            
-            # Orientation from phase relationships
-            orientation = (phase_a + phase_b + phase_c) / 3
-            
-            components[11] += trivector_strength * np.sin(orientation)
-            components[12] += trivector_strength * np.cos(orientation)
-            components[13] += trivector_strength * np.sin(2*orientation)
-            components[14] += trivector_strength * np.cos(2*orientation)
+        # Orientation from phase relationships
+        orientation = triad_phases.sum(axis=1) / 3
+        
+        components[11] = trivector_strength * np.sin(orientation).sum()
+        components[12] = trivector_strength * np.cos(orientation).sum()
+        components[13] = trivector_strength * np.sin(2*orientation).sum()
+        components[14] = trivector_strength * np.cos(2*orientation).sum()
     
     # === GRADE-4: Graph chirality → Pseudoscalar ===
-    
-    chirality = compute_graph_chirality(graph, adjacency)
-    components[15] = chirality * 0.5
+    # Z/X imbalance scaled by phase spread (see compute_graph_chirality)
+    imbalance = (2 * np.count_nonzero(is_z) - num_nodes) / num_nodes
+    phase_var = phases.var() if num_nodes > 1 else 0.0
+    components[15] = imbalance * np.sqrt(phase_var) * 0.1 * 0.5
     
     # Normalize to unit magnitude
     magnitude = np.linalg.norm(components)
@@ -142,6 +145,34 @@ def zx_to_clifford(graph: ZXGraph) -> np.ndarray:
     return components
 
 
+def _triangles_from_edges(src: np.ndarray, dst: np.ndarray, num_nodes: int) -> np.ndarray:
+    """
+    Triangles as (i, j, k) node positions with i < j < k.
+    
+    Same triads, in the same order, as detect_triangles.
+    """
+    upper = np.zeros((num_nodes, num_nodes), dtype=bool)
+    upper[np.minimum(src, dst), np.maximum(src, dst)] = True
+    
+    if num_nodes <= 64:
+        # Small graphs: test every (i, j, k) at once (≤ 64³ booleans)
+        mask = upper[:, :, None] & upper[None, :, :] & upper[:, None, :]
+        return np.argwhere(mask)
+    
+    triads = []
+    for i in range(num_nodes - 2):
+        nbrs = np.flatnonzero(upper[i])  # j > i adjacent to i
+        if nbrs.size < 2:
+            continue
+        jj, kk = np.nonzero(upper[np.ix_(nbrs, nbrs)])
+        if jj.size:
+            triads.append(np.column_stack((np.full(jj.size, i), nbrs[jj], nbrs[kk])))
+    
+    if not triads:
+        return np.empty((0, 3), dtype=np.intp)
+    return np.concatenate(triads)
+
+
 def build_adjacency(graph: ZXGraph) -> Dict[int, List[int]]:
     """Build adjacency list from edge list"""
     adjacency = {node: [] for node in graph.nodes}
@@ -60,6 +60,14 @@ def compute_eigendecomposition(C_matrix: np.ndarray) -> Dict:
     }
 
 
+# φ-related eigenvalue targets: φ^k for k in [-2, 3], then n·φ and n/φ
+PHI_TARGETS = np.array(
+    [PHI**k for k in range(-2, 4)]
+    + [n * PHI for n in range(1, 6)]
+    + [n / PHI for n in range(1, 4)]
+)
+
+
 def identify_phi_eigenvalues(eigenvalues: np.ndarray, tolerance: float = 0.1) -> List[int]:
     """
     Identify which eigenvalues are φ-related.
@@ -73,23 +81,10 @@ def identify_phi_eigenvalues(eigenvalues: np.ndarray, tolerance: float = 0.1) ->
     Returns:
         List of indices for φ-related eigenvalues
     """
-    phi_indices = []
-    
-    # φ powers to check: φ^k for k in [-2, 3]
-    phi_powers = [PHI**k for k in range(-2, 4)]
-    
-    # Also check multiples: n*φ for small n
-    phi_multiples = [n * PHI for n in range(1, 6)]
-    phi_multiples += [n / PHI for n in range(1, 4)]
-    
-    targets = phi_powers + phi_multiples
-    
-    for i, lam in enumerate(eigenvalues):
-        for target in targets:
-            relative_error = abs(lam - target) / (target + 1e-10)
-            if relative_error < tolerance:
-                phi_indices.append(i)
-                break
+    # Relative error of every eigenvalue against every target at once
+    eigenvalues = np.asarray(eigenvalues)
+    relative_error = np.abs(eigenvalues[:, None] - PHI_TARGETS) / (PHI_TARGETS + 1e-10)
+    phi_indices = np.flatnonzero((relative_error < tolerance).any(axis=1)).tolist()
     
     return phi_indices
 
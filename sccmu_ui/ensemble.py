@@ -353,8 +353,7 @@ def estimate_ensemble_diversity(ensemble: List[ZXGraph]) -> Dict:
         z_counts.append(z_count)
         x_counts.append(x_count)
         
-        for l in g.labels.values():
-            phases.append(l.phase_radians)
+        phases.extend(g.soa['phase_rad'])
         
         max_edges = len(g.nodes) * (len(g.nodes) - 1) / 2
         density = len(g.edges) / max_edges if max_edges > 0 else 0
@@ -19,7 +19,7 @@ import copy
 from .zx_core import ZXGraph, NodeLabel, create_seed_graph, PHI, add_phases
 from .coherence import compute_coherence_matrix, coherence_between_diagrams
 from .free_energy import (
-    compute_free_energy, compute_functional_derivative,
+    compute_free_energy,
     verify_fixed_point, BETA
 )
 
@@ -46,6 +46,23 @@ class ZXEvolutionEngine:
     """
     
     def __init__(self, ensemble_size=20, annealing_schedule=None):
+        # Parameters
+        self.nu = 1.0 / (2*np.pi*PHI)  # Diffusion coefficient
+        self.ensemble_size = ensemble_size
+        self.annealing_schedule = annealing_schedule  # Optional temperature schedule
+        
+        self.reset()
+    
+    def reset(self, ensemble_size=None):
+        """
+        Return to the seed diagram with cleared history and caches.
+        
+        Leaves the engine as freshly constructed (optionally with a new
+        ensemble size), so one instance can be reused across runs.
+        """
+        if ensemble_size is not None:
+            self.ensemble_size = ensemble_size
+        
         # Start with seed diagram
         self.mode_graph = create_seed_graph()
         
@@ -56,6 +73,10 @@ class ZXEvolutionEngine:
         # Precomputed coherence matrix
         self.C_matrix = None
         
+        # Row cache for incremental coherence updates between steps
+        self._C_cache = None
+        self._diag_keys = []
+        
         # Evolution tracking
         self.time = 0.0
         self.free_energy_history = []
@@ -63,12 +84,12 @@ class ZXEvolutionEngine:
         self.mode_probability_history = []
         self.beta_history = []  # Track temperature schedule
         
-        # Parameters
-        self.nu = 1.0 / (2*np.pi*PHI)  # Diffusion coefficient
-        self.ensemble_size = ensemble_size
-        self.annealing_schedule = annealing_schedule  # Optional temperature schedule
         self.current_beta = BETA  # Current inverse temperature
         self.step_count = 0  # Track evolution steps
+        
+        # Scratch buffers for the in-place ρ update (grown on demand)
+        self._grad_buf = np.empty(self.ensemble_size)
+        self._rho_buf = np.empty(self.ensemble_size)
     
     def generate_variations(self, graph: ZXGraph, max_variations: int = 20) -> List[ZXGraph]:
         """
@@ -132,6 +153,142 @@ class ZXEvolutionEngine:
         
         return variations[:max_variations]
     
+    def _update_coherence_matrix(self) -> np.ndarray:
+        """
+        Update cached coherence matrix for the current ensemble.
+        
+        Only rows/columns whose diagram changed since the previous step
+        are recomputed; a change of ensemble size forces a full rebuild.
+        """
+        keys = [D.canonical_key() for D in self.ensemble]
+        n = len(keys)
+        
+        if self._C_cache is None or self._C_cache.shape[0] != n:
+            self._C_cache = compute_coherence_matrix(self.ensemble)
+        else:
+            for i in range(n):
+                if keys[i] == self._diag_keys[i]:
+                    continue
+                row = [coherence_between_diagrams(self.ensemble[i], D) for D in self.ensemble]
+                self._C_cache[i, :] = row
+                self._C_cache[:, i] = row
+        
+        self._diag_keys = keys
+        return self._C_cache
+    
+    def _drift(self, rho: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Master equation drift ∂ρ/∂t = -(δℱ/δρ - mean), written into `out`.
+        
+        δℱ/δρ = -2(𝒞ρ) + (1/β)(log ρ + 1), as in compute_functional_derivative,
+        evaluated with the current 𝒞 and β. Uses `_rho_buf` as scratch.
+        """
+        log_term = self._rho_buf[:len(rho)]
+        
+        # (1/β)(log ρ + 1)
+        np.maximum(rho, 1e-10, out=log_term)
+        np.log(log_term, out=log_term)
+        log_term += 1
+        log_term *= 1 / self.current_beta
+        
+        # δℱ/δρ = -2(𝒞ρ) + log term
+        np.dot(self.C_matrix, rho, out=out)
+        out *= -2
+        out += log_term
+        
+        # Gradient ascent on ℱ, mean removed to preserve normalization
+        out -= out.mean()
+        np.negative(out, out=out)
+        return out
+    
+    def _scratch(self, n: int):
+        """Grow the drift scratch buffers to hold n diagrams"""
+        if self._grad_buf.shape[0] < n:
+            self._grad_buf = np.empty(n)
+            self._rho_buf = np.empty(n)
+    
+    def _gradient_step(self, dt: float):
+        """
+        In-place gradient ascent step on ℱ for the ensemble ρ.
+        
+        Drift is evaluated into preallocated scratch buffers, then ρ is
+        projected back to the probability simplex.
+        """
+        rho = self.ensemble_rho
+        n = len(rho)
+        self._scratch(n)
+        
+        drift = self._drift(rho, self._grad_buf[:n])
+        drift *= dt
+        rho += drift
+        
+        # Project to probability simplex
+        np.maximum(rho, 0, out=rho)
+        rho /= rho.sum()
+    
+    def _heun_step(self, dt: float, tol: float, dt_min: float) -> float:
+        """
+        In-place Heun (RK2) step of ρ with step-size control.
+        
+        Starting from dt, the step is halved (down to dt_min) until the
+        local error estimate (dt/2)·||f(ρ + dt·f(ρ)) - f(ρ)||, the gap
+        between the Euler and Heun updates, is below `tol`. The accepted
+        Heun update ρ += (dt/2)(k₁ + k₂) is then projected back to the
+        probability simplex. 𝒞 and β must already be set for the step.
+        
+        Returns:
+            The dt actually taken
+        """
+        rho = self.ensemble_rho
+        n = len(rho)
+        self._scratch(n)
+        
+        k1 = self._drift(rho, self._grad_buf[:n])
+        k2 = np.empty(n)
+        while True:
+            self._drift(rho + dt * k1, k2)
+            error = 0.5 * dt * float(np.linalg.norm(k2 - k1))
+            if error <= tol or dt <= dt_min:
+                break
+            dt = max(dt / 2, dt_min)
+        
+        k1 += k2
+        k1 *= 0.5 * dt
+        rho += k1
+        
+        # Project to probability simplex
+        np.maximum(rho, 0, out=rho)
+        rho /= rho.sum()
+        return dt
+    
+    def evolve_adaptive(self, total_time: float, tol: float = 1e-3,
+                        dt_max: float = 0.05, dt_min: float = 0.01) -> dict:
+        """
+        Evolve for `total_time` with adaptive Heun (RK2) steps.
+        
+        Each step builds its ensemble and 𝒞 first, then starts from the
+        previous accepted dt (doubled, capped at dt_max) and halves it
+        until the Euler/Heun error estimate on that ensemble is below
+        `tol` or dt reaches dt_min (see `_heun_step`). History and
+        observables are tracked per step as in evolve_step; convergence
+        is checked once at the end.
+        
+        Returns:
+            State dictionary of the final step
+        """
+        assert total_time > 0, "total_time must be positive"
+        dt = dt_max
+        remaining = total_time
+        
+        while remaining > 1e-12:
+            self._prepare_step()
+            dt = self._heun_step(min(dt, remaining), tol, min(dt_min, remaining))
+            self._finish_step(dt)
+            remaining -= dt
+            dt = min(2 * dt, dt_max)
+        
+        return self._step_state()
+    
     def evolve_step(self, dt: float) -> dict:
         """
         Single master equation evolution step.
@@ -142,6 +299,36 @@ class ZXEvolutionEngine:
         Returns:
             State dictionary with mode, F, convergence info
         """
+        self._advance(dt)
+        return self._step_state()
+    
+    def evolve_steps(self, n_steps: int, dt: float) -> dict:
+        """
+        Take `n_steps` evolution steps of size dt.
+        
+        Same trajectory and history as calling evolve_step n_steps
+        times, but the state dictionary and convergence check (an
+        eigen-solve) are only built once, after the last step.
+        
+        Returns:
+            State dictionary of the final step
+        """
+        assert n_steps >= 1, "n_steps must be positive"
+        for _ in range(n_steps):
+            self._advance(dt)
+        return self._step_state()
+    
+    def _advance(self, dt: float):
+        """Advance ρ, mode and history by one step (steps 0-8 of evolve_step)"""
+        self._prepare_step()
+        
+        # 4-5. Functional derivative and master equation step (in place)
+        self._gradient_step(dt)
+        
+        self._finish_step(dt)
+    
+    def _prepare_step(self):
+        """Set β, the ensemble, ρ and 𝒞 for the next step (steps 0-3)"""
         # 0. Update temperature if annealing
         if self.annealing_schedule is not None:
             self.current_beta = self.annealing_schedule.get_beta(self.step_count)
@@ -159,33 +346,20 @@ class ZXEvolutionEngine:
             # Uniform initialization over new ensemble
             self.ensemble_rho = np.ones(n) / n
         
-        # 3. Compute coherence matrix
-        self.C_matrix = compute_coherence_matrix(self.ensemble)
-        
-        # 4. Compute functional derivative (with current β)
-        delta_F = compute_functional_derivative(
-            self.ensemble, self.ensemble_rho, self.C_matrix, beta=self.current_beta
-        )
-        
-        # 5. Master equation evolution (simplified gradient descent)
-        # ∂ρ/∂t ∝ -δℱ/δρ (gradient ascent on ℱ)
-        # Keep probability normalized
-        drho_dt = -delta_F + np.mean(delta_F)  # Subtract mean to preserve normalization
-        
-        # Update with timestep
-        self.ensemble_rho += drho_dt * dt
-        
-        # Project to probability simplex
-        self.ensemble_rho = np.maximum(self.ensemble_rho, 0)
-        self.ensemble_rho /= np.sum(self.ensemble_rho)
-        
+        # 3. Compute coherence matrix (only rows whose diagram changed)
+        self.C_matrix = self._update_coherence_matrix()
+    
+    def _finish_step(self, dt: float):
+        """Update mode, observables and history after ρ moved (steps 6-8)"""
         # 6. Find mode (most probable diagram)
         mode_idx = np.argmax(self.ensemble_rho)
         self.mode_graph = self.ensemble[mode_idx].copy()
         mode_prob = self.ensemble_rho[mode_idx]
         
         # 7. Compute observables (with current β)
-        F = compute_free_energy(self.ensemble, self.ensemble_rho, beta=self.current_beta)
+        F = compute_free_energy(
+            self.ensemble, self.ensemble_rho, beta=self.current_beta, C_matrix=self.C_matrix
+        )
         
         # Mode coherence (for visualization)
         mode_coherence = coherence_between_diagrams(self.mode_graph, self.mode_graph)
@@ -196,16 +370,20 @@ class ZXEvolutionEngine:
         self.mode_probability_history.append(mode_prob)
         self.beta_history.append(self.current_beta)
         self.time += dt
-        
+    
+    def _step_state(self) -> dict:
+        """State dictionary for the most recent step"""
         # 9. Check convergence
         convergence = self.check_convergence()
         
         return {
             'mode_graph': self.mode_graph,
-            'mode_probability': mode_prob,
-            'free_energy': F,
-            'mode_coherence': mode_coherence,
-            'num_diagrams': n,
+            'num_nodes': len(self.mode_graph.nodes),
+            'num_edges': len(self.mode_graph.edges),
+            'mode_probability': self.mode_probability_history[-1],
+            'free_energy': self.free_energy_history[-1],
+            'mode_coherence': self.coherence_history[-1],
+            'num_diagrams': len(self.ensemble),
             'time': self.time,
             'beta': self.current_beta,
             'temperature': 1.0 / self.current_beta if self.current_beta > 0 else float('inf'),
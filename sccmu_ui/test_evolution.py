@@ -7,7 +7,8 @@ Verifies Theory.md Definition 2.1.3 and Theorem 2.1.2.
 
 import pytest
 import numpy as np
-from .zx_core import PHI
+from .zx_core import ZXGraph, NodeLabel, PHI
+from .coherence import compute_coherence_matrix
 from .evolution_engine import ZXEvolutionEngine
 
 
@@ -91,6 +92,49 @@ class TestEvolutionEngine:
         
         state = engine.get_state()
         assert abs(state['mode_probability'] - mode_prob) < 1e-6
+    
+    def test_incremental_coherence_matrix(self):
+        """Cached 𝒞 matches full recomputation after several steps"""
+        engine = ZXEvolutionEngine(ensemble_size=10)
+        
+        for _ in range(8):
+            engine.evolve_step(dt=0.01)
+            
+            C_full = compute_coherence_matrix(engine.ensemble)
+            assert np.allclose(engine.C_matrix, C_full), \
+                "Incremental coherence matrix diverged from full recomputation"
+    
+    def test_evolve_steps_matches_loop(self):
+        """Batched steps follow the same trajectory as single steps"""
+        np.random.seed(7)
+        looped = ZXEvolutionEngine(ensemble_size=8)
+        for _ in range(6):
+            state_loop = looped.evolve_step(dt=0.01)
+        
+        np.random.seed(7)
+        batched = ZXEvolutionEngine(ensemble_size=8)
+        state_batch = batched.evolve_steps(6, dt=0.01)
+        
+        assert batched.free_energy_history == looped.free_energy_history
+        assert np.array_equal(batched.ensemble_rho, looped.ensemble_rho)
+        assert state_batch['free_energy'] == state_loop['free_energy']
+        assert state_batch['time'] == state_loop['time']
+    
+    def test_reset_matches_fresh_engine(self):
+        """reset() restores the freshly constructed state"""
+        engine = ZXEvolutionEngine(ensemble_size=10)
+        for _ in range(5):
+            engine.evolve_step(dt=0.01)
+        
+        engine.reset(ensemble_size=6)
+        fresh = ZXEvolutionEngine(ensemble_size=6)
+        
+        assert engine.ensemble_size == 6
+        assert engine.time == 0.0 and engine.step_count == 0
+        assert engine.free_energy_history == []
+        assert engine.C_matrix is None
+        assert engine.mode_graph == fresh.mode_graph
+        assert np.array_equal(engine.ensemble_rho, fresh.ensemble_rho)
 
 
 class TestConvergence:
@@ -112,12 +156,14 @@ class TestConvergence:
         """Long evolution should approach convergence"""
         engine = ZXEvolutionEngine(ensemble_size=8)
         
-        # Run many steps
+        # Evolve to t = 0.5 with adaptive steps, sampling every 0.1
         convergence_checks = []
-        for i in range(50):
-            state = engine.evolve_step(dt=0.01)
-            if i % 10 == 9:
-                convergence_checks.append(state['convergence'])
+        for _ in range(5):
+            state = engine.evolve_adaptive(total_time=0.1)
+            convergence_checks.append(state['convergence'])
+        
+        assert abs(engine.time - 0.5) < 1e-9
+        assert engine.step_count < 50, "Adaptive stepping should need fewer steps"
         
         # Check if residuals decrease
         residuals = [c['residual'] for c in convergence_checks if 'residual' in c]
@@ -125,6 +171,39 @@ class TestConvergence:
         if len(residuals) > 2:
             print(f"Residuals: {residuals[0]:.4f} → {residuals[-1]:.4f}")
             # Should generally decrease (or stay low)
+    
+    def test_adaptive_matches_fine_fixed_step(self):
+        """Adaptive Heun steps track a fine fixed-dt run of the same ρ flow"""
+        frozen = [
+            ZXGraph([0], [], {0: NodeLabel('Z', 0, 1, 0)}),
+            ZXGraph([0, 1], [(0, 1)], {0: NodeLabel('Z', 0, 1, 0), 1: NodeLabel('Z', 1, 8, 1)}),
+            ZXGraph([0, 1], [(0, 1)], {0: NodeLabel('Z', 0, 1, 0), 1: NodeLabel('X', 1, 4, 1)}),
+            ZXGraph([0, 1, 2], [(0, 1), (1, 2)], {i: NodeLabel('Z', i, 8, i) for i in range(3)}),
+        ]
+        
+        def make_engine():
+            # Fixed ensemble, so ρ follows one ODE regardless of step count
+            engine = ZXEvolutionEngine(ensemble_size=len(frozen))
+            engine.generate_variations = lambda graph, max_variations=20: [D.copy() for D in frozen]
+            engine.ensemble_rho = np.array([0.55, 0.25, 0.15, 0.05])
+            return engine
+        
+        total_time = 0.5
+        fine = make_engine()
+        fine.evolve_steps(2000, dt=total_time / 2000)
+        
+        adaptive = make_engine()
+        adaptive.evolve_adaptive(total_time=total_time)
+        assert abs(adaptive.time - total_time) < 1e-9
+        
+        # Euler with as many steps as the adaptive run took
+        coarse = make_engine()
+        coarse.evolve_steps(adaptive.step_count, dt=total_time / adaptive.step_count)
+        
+        adaptive_error = np.abs(adaptive.ensemble_rho - fine.ensemble_rho).max()
+        coarse_error = np.abs(coarse.ensemble_rho - fine.ensemble_rho).max()
+        assert adaptive_error < 2e-3, f"Adaptive run drifted from fine run by {adaptive_error}"
+        assert adaptive_error < coarse_error
 
 
 class TestTheoryCompliance:
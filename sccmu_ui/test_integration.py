@@ -18,16 +18,31 @@ import pytest
 import numpy as np
 from .zx_core import create_seed_graph, PHI
 from .evolution_engine import ZXEvolutionEngine
-from .clifford_mapping import zx_to_clifford, get_clifford_grade_decomposition
+from .clifford_mapping import zx_to_clifford, zx_to_clifford_soa, get_clifford_grade_decomposition
+
+
+@pytest.fixture(scope="module")
+def shared_engine():
+    """One engine reused across this module's tests"""
+    return ZXEvolutionEngine(ensemble_size=10)
+
+
+@pytest.fixture
+def make_engine(shared_engine):
+    """Reset the shared engine to the seed graph with a given ensemble size"""
+    def make(ensemble_size=10):
+        shared_engine.reset(ensemble_size=ensemble_size)
+        return shared_engine
+    return make
 
 
 class TestCompletePipeline:
     """Test full Theory.md pipeline"""
     
-    def test_initialization_to_clifford(self):
+    def test_initialization_to_clifford(self, make_engine):
         """Seed → Evolution → Clifford"""
         # 1. Create engine (starts with seed graph)
-        engine = ZXEvolutionEngine(ensemble_size=10)
+        engine = make_engine(ensemble_size=10)
         
         # 2. Get initial state
         state = engine.get_state()
@@ -39,15 +54,14 @@ class TestCompletePipeline:
         assert len(clifford) == 16
         assert abs(np.linalg.norm(clifford) - 1.0) < 1e-6
     
-    def test_evolution_increases_complexity(self):
+    def test_evolution_increases_complexity(self, make_engine):
         """Evolution should grow graph complexity"""
-        engine = ZXEvolutionEngine(ensemble_size=15)
+        engine = make_engine(ensemble_size=15)
         
         initial_nodes = len(engine.mode_graph.nodes)
         
         # Evolve
-        for _ in range(30):
-            engine.evolve_step(dt=0.01)
+        engine.evolve_steps(30, dt=0.01)
         
         final_nodes = len(engine.mode_graph.nodes)
         
@@ -57,20 +71,19 @@ class TestCompletePipeline:
         # Growth expected (though not guaranteed every run)
         assert final_nodes >= initial_nodes
     
-    def test_clifford_field_evolves(self):
+    def test_clifford_field_evolves(self, make_engine):
         """Clifford field changes as graph evolves"""
-        engine = ZXEvolutionEngine(ensemble_size=10)
+        engine = make_engine(ensemble_size=10)
         
         # Initial Clifford field
-        clifford_initial = zx_to_clifford(engine.mode_graph)
+        clifford_initial = zx_to_clifford_soa(engine.mode_graph.soa)
         decomp_initial = get_clifford_grade_decomposition(clifford_initial)
         
         # Evolve
-        for _ in range(20):
-            engine.evolve_step(dt=0.01)
+        engine.evolve_steps(20, dt=0.01)
         
         # Final Clifford field
-        clifford_final = zx_to_clifford(engine.mode_graph)
+        clifford_final = zx_to_clifford_soa(engine.mode_graph.soa)
         decomp_final = get_clifford_grade_decomposition(clifford_final)
         
         print(f"Initial: scalar={decomp_initial['scalar']:.3f}, " +
@@ -88,9 +101,9 @@ class TestCompletePipeline:
 class TestTheoryCompliance:
     """Verify all Theory.md axioms and theorems"""
     
-    def test_all_four_axioms(self):
+    def test_all_four_axioms(self, make_engine):
         """Complete axiom verification"""
-        engine = ZXEvolutionEngine(ensemble_size=10)
+        engine = make_engine(ensemble_size=10)
         
         # Axiom 1: Configuration space = ZX-diagrams ✓
         assert hasattr(engine, 'mode_graph')
@@ -106,9 +119,9 @@ class TestTheoryCompliance:
         # Axiom 4: φ-scaling ✓
         assert abs(engine.nu - 1.0/(2*np.pi*PHI)) < 1e-10
     
-    def test_definition_2_1_3_master_equation(self):
+    def test_definition_2_1_3_master_equation(self, make_engine):
         """Master equation: ∂ρ/∂t = ∇·(ρ∇δℱ/δρ) + ν∆ρ"""
-        engine = ZXEvolutionEngine(ensemble_size=8)
+        engine = make_engine(ensemble_size=8)
         
         # Track ρ evolution
         rho_initial = engine.ensemble_rho.copy()
@@ -125,13 +138,12 @@ class TestTheoryCompliance:
         # Valid range (can be 0 if equilibrium, or >0 if evolving)
         assert drho >= 0.0
     
-    def test_theorem_2_1_2_convergence(self):
+    def test_theorem_2_1_2_convergence(self, make_engine):
         """Convergence to fixed point: 𝒞ρ_∞ = λ_max ρ_∞"""
-        engine = ZXEvolutionEngine(ensemble_size=10)
+        engine = make_engine(ensemble_size=10)
         
         # Evolve toward equilibrium
-        for _ in range(50):
-            state = engine.evolve_step(dt=0.01)
+        state = engine.evolve_steps(50, dt=0.01)
         
         # Check fixed point condition
         conv = state['convergence']
@@ -143,9 +155,9 @@ class TestTheoryCompliance:
         print(f"Residual = {conv['residual']:.6f}")
         print(f"Is fixed point: {conv['is_fixed_point']}")
     
-    def test_theorem_1_0_3_3_zx_clifford_equivalence(self):
+    def test_theorem_1_0_3_3_zx_clifford_equivalence(self, make_engine):
         """ZX ≅ Clifford correspondence works throughout evolution"""
-        engine = ZXEvolutionEngine(ensemble_size=10)
+        engine = make_engine(ensemble_size=10)
         
         for i in range(30):
             state = engine.evolve_step(dt=0.01)
@@ -162,18 +174,17 @@ class TestTheoryCompliance:
 class TestEmergentComplexity:
     """Verify emergent complexity appears"""
     
-    def test_graph_growth(self):
+    def test_graph_growth(self, make_engine):
         """Graph should grow from seed"""
-        engine = ZXEvolutionEngine(ensemble_size=15)
+        engine = make_engine(ensemble_size=15)
         
         node_counts = []
         edge_counts = []
         
         for _ in range(40):
             state = engine.evolve_step(dt=0.01)
-            final_state = engine.get_state()
-            node_counts.append(final_state['num_nodes'])
-            edge_counts.append(final_state['num_edges'])
+            node_counts.append(state['num_nodes'])
+            edge_counts.append(state['num_edges'])
         
         max_nodes = max(node_counts)
         max_edges = max(edge_counts)
@@ -183,13 +194,12 @@ class TestEmergentComplexity:
         # Should see some growth (though mode might fluctuate)
         assert max_nodes >= 1
     
-    def test_clifford_grades_emerge(self):
+    def test_clifford_grades_emerge(self, make_engine):
         """All Clifford grades should eventually appear"""
-        engine = ZXEvolutionEngine(ensemble_size=15)
+        engine = make_engine(ensemble_size=15)
         
         # Evolve to build structure
-        for _ in range(50):
-            engine.evolve_step(dt=0.01)
+        engine.evolve_steps(50, dt=0.01)
         
         # Map to Clifford
         clifford = zx_to_clifford(engine.mode_graph)
@@ -205,15 +215,12 @@ class TestEmergentComplexity:
         total_mag = decomp['total_magnitude']
         assert abs(total_mag - 1.0) < 1e-6
     
-    def test_free_energy_approaches_maximum(self):
+    def test_free_energy_approaches_maximum(self, make_engine):
         """ℱ[ρ] should approach maximum (Axiom 3)"""
-        engine = ZXEvolutionEngine(ensemble_size=12)
-        
-        F_values = []
+        engine = make_engine(ensemble_size=12)
         
-        for _ in range(60):
-            state = engine.evolve_step(dt=0.01)
-            F_values.append(state['free_energy'])
+        engine.evolve_steps(60, dt=0.01)
+        F_values = engine.free_energy_history
         
         # Check if F stabilizes
         if len(F_values) >= 20:
@@ -229,13 +236,12 @@ class TestEmergentComplexity:
 class TestTheoryPredictions:
     """Test Theory.md predictions"""
     
-    def test_phi_scaling_in_eigenvalues(self):
+    def test_phi_scaling_in_eigenvalues(self, make_engine):
         """λ_max should be φ-related (Theory.md)"""
-        engine = ZXEvolutionEngine(ensemble_size=10)
+        engine = make_engine(ensemble_size=10)
         
         # Evolve to equilibrium
-        for _ in range(50):
-            engine.evolve_step(dt=0.01)
+        engine.evolve_steps(50, dt=0.01)
         
         conv = engine.check_convergence()
         
@@ -243,8 +249,8 @@ class TestTheoryPredictions:
             lambda_max = conv['lambda_max']
             
             # Check if close to φ^k for some k
-            phi_powers = [PHI**k for k in range(-2, 4)]
-            closest = min(phi_powers, key=lambda p: abs(p - lambda_max))
+            phi_powers = PHI ** np.arange(-2, 4)
+            closest = phi_powers[np.argmin(np.abs(phi_powers - lambda_max))]
             error = abs(lambda_max - closest) / (closest + 1e-10)
             
             print(f"λ_max = {lambda_max:.4f}, closest φ^k = {closest:.4f}, error = {error:.2%}")
@@ -10,10 +10,19 @@ Tests Theory.md compliance:
 
 import pytest
 import numpy as np
+from . import zx_core
 from .zx_core import (
     NodeLabel, ZXGraph, create_seed_graph, 
-    normalize_phase, add_phases, graphs_equal, PHI
+    normalize_phase, add_phases, graphs_equal, PHI, KIND_Z, KIND_X
 )
+from . import _zx_numba
+from ._zx_numba import phases_equal, phase_distance
+
+
+@pytest.fixture
+def label_validation(monkeypatch):
+    """Enable per-label checks (normally off unless ZX_VALIDATE=1)"""
+    monkeypatch.setattr(zx_core, '_ZX_VALIDATE', True)
 
 
 class TestNodeLabel:
@@ -31,12 +40,12 @@ class TestNodeLabel:
         assert label.kind == 'X'
         assert label.phase_radians == np.pi/4
     
-    def test_invalid_kind(self):
+    def test_invalid_kind(self, label_validation):
         """Invalid spider type should raise"""
         with pytest.raises(AssertionError):
             NodeLabel('Y', 0, 1, 0)
     
-    def test_non_power_of_2_denominator(self):
+    def test_non_power_of_2_denominator(self, label_validation):
         """Non-power-of-2 denominator violates Qπ compliance"""
         with pytest.raises(AssertionError):
             NodeLabel('Z', 1, 3, 0)  # 3 is not power of 2
@@ -51,6 +60,16 @@ class TestNodeLabel:
         assert not NodeLabel.is_power_of_2(3)
         assert not NodeLabel.is_power_of_2(6)
         assert not NodeLabel.is_power_of_2(10)
+    
+    def test_batch_validate(self):
+        """Bulk check accepts kind strings or codes"""
+        NodeLabel.batch_validate(['Z', 'X'], [1, 3], [2, 8])
+        NodeLabel.batch_validate(np.array([KIND_Z, KIND_X]), [0, 1], [1, 4])
+        
+        with pytest.raises(AssertionError):
+            NodeLabel.batch_validate(['Z', 'Y'], [0, 0], [1, 1])
+        with pytest.raises(AssertionError, match="power of 2"):
+            NodeLabel.batch_validate(['Z', 'X'], [1, 1], [4, 6])
 
 
 class TestZXGraph:
@@ -95,6 +114,21 @@ class TestZXGraph:
         with pytest.raises(AssertionError, match="Self-loop"):
             G.validate()
     
+    def test_revalidate_after_in_place_edit(self):
+        """A cached successful validation does not survive an edit"""
+        G = create_seed_graph()
+        assert G.validate()
+        
+        G.edges.append((0, 0))
+        with pytest.raises(AssertionError, match="Self-loop"):
+            G.validate()
+        
+        G.edges.pop()
+        assert G.validate()
+        G.nodes.append(1)
+        with pytest.raises(AssertionError, match="has no label"):
+            G.validate()
+    
     def test_missing_label(self):
         """All nodes must have labels"""
         G = ZXGraph(
@@ -106,6 +140,38 @@ class TestZXGraph:
         with pytest.raises(AssertionError, match="has no label"):
             G.validate()
     
+    def test_validate_kernels_agree(self):
+        """Compiled and vectorized SoA validation report the same failure"""
+        ids = np.array([0, 1, 2, 1000], dtype=np.int32)
+        kinds = np.array([0, 1, 0, 1], dtype=np.int8)
+        denoms = np.array([1, 2, 4, 8], dtype=np.int32)
+        cases = [
+            ([0, 1], [1, 2], (_zx_numba.VALID, 0)),
+            ([0, 2], [1, 2], (_zx_numba.SELF_LOOP, 2)),
+            ([0, 1], [1000, 7], (_zx_numba.UNKNOWN_NODE, 7)),
+        ]
+        for src, dst, expected in cases:
+            args = (ids, np.array(src, dtype=np.int32), np.array(dst, dtype=np.int32), kinds, denoms)
+            assert tuple(int(v) for v in _zx_numba._validate_soa_loop(*args)) == expected
+            assert tuple(_zx_numba._validate_soa_numpy(*args)) == expected
+        
+        bad_denoms = np.array([1, 2, 6, 8], dtype=np.int32)
+        args = (ids, np.array([0], dtype=np.int32), np.array([1], dtype=np.int32), kinds, bad_denoms)
+        assert tuple(int(v) for v in _zx_numba._validate_soa_loop(*args)) == (_zx_numba.BAD_DENOM, 6)
+        assert tuple(_zx_numba._validate_soa_numpy(*args)) == (_zx_numba.BAD_DENOM, 6)
+    
+    def test_invalid_label_caught_by_graph(self, monkeypatch):
+        """Graph validation checks labels even when construction doesn't"""
+        monkeypatch.setattr(zx_core, '_ZX_VALIDATE', False)
+        G = ZXGraph(
+            nodes=[0, 1],
+            edges=[(0, 1)],
+            labels={0: NodeLabel('Z', 0, 1, 0), 1: NodeLabel('X', 1, 3, 1)}
+        )
+        
+        with pytest.raises(AssertionError, match="power of 2"):
+            G.validate()
+    
     def test_invalid_edge(self):
         """Edges must reference valid nodes"""
         G = ZXGraph(
@@ -116,6 +182,51 @@ class TestZXGraph:
         
         with pytest.raises(AssertionError, match="unknown node"):
             G.validate()
+    
+    def test_soa_matches_labels(self):
+        """Struct-of-arrays view mirrors label dict"""
+        G = ZXGraph(
+            nodes=[0, 1],
+            edges=[(0, 1)],
+            labels={
+                0: NodeLabel('Z', 0, 1, 0),
+                1: NodeLabel('X', 3, 8, 1)
+            }
+        )
+        
+        soa = G.soa
+        assert list(soa['node_id']) == [0, 1]
+        assert list(soa['kind']) == [KIND_Z, KIND_X]
+        assert list(soa['phase_numer']) == [0, 3]
+        assert list(soa['phase_denom']) == [1, 8]
+        assert list(soa['edges_packed']) == [(0 << 32) | 1]
+        assert np.array_equal(soa['phase_rad'], [G.labels[0].phase_radians, G.labels[1].phase_radians])
+        
+        # In-place mutation is picked up on the next read
+        G.nodes.append(2)
+        G.labels[2] = NodeLabel('Z', 1, 2, 2)
+        assert list(G.soa['node_id']) == [0, 1, 2]
+        G.labels[1] = NodeLabel('Z', 1, 4, 1)
+        assert list(G.soa['kind']) == [KIND_Z, KIND_Z, KIND_Z]
+        G.edges = [(1, 2)]
+        assert list(G.soa['edge_src']) == [1]
+    
+    def test_label_records_roundtrip(self):
+        """Packed label records rebuild the original labels"""
+        G = ZXGraph(
+            nodes=[0, 1],
+            edges=[(0, 1)],
+            labels={
+                0: NodeLabel('Z', 0, 1, 0),
+                1: NodeLabel('X', 3, 8, 1)
+            }
+        )
+        
+        records = G.label_records()
+        assert records.dtype.itemsize == 13
+        assert [NodeLabel.from_record(r) for r in records] == [G.labels[0], G.labels[1]]
+        assert np.allclose(np.pi * records['numer'] / records['denom'],
+                           [G.labels[0].phase_radians, G.labels[1].phase_radians])
 
 
 class TestPhaseArithmetic:
@@ -153,6 +264,16 @@ class TestPhaseArithmetic:
         # Result must be power of 2
         n, d = add_phases(1, 2, 1, 4)
         assert NodeLabel.is_power_of_2(d)
+    
+    def test_integer_phase_comparison(self):
+        """Cross-multiplied phase comparison needs no float tolerance"""
+        # π/8 vs 2π/16
+        assert phases_equal(1, 8, 2, 16)
+        assert phase_distance(1, 8, 2, 16) == 0
+        
+        # π/8 vs 2π/8: |1·8 - 2·8| = 8 = (1/8)·64
+        assert not phases_equal(1, 8, 2, 8)
+        assert phase_distance(1, 8, 2, 8) == 8
 
 
 class TestGraphEquality:
@@ -186,6 +307,39 @@ class TestGraphEquality:
             labels={0: NodeLabel('Z', 1, 4, 0)}  # phase = π/4
         )
         assert not graphs_equal(G1, G2)
+    
+    def test_fingerprint_order_independent(self):
+        """Fingerprint ignores node/edge ordering, tracks in-place edits"""
+        labels = {
+            0: NodeLabel('Z', 0, 1, 0),
+            1: NodeLabel('X', 1, 2, 1),
+            2: NodeLabel('Z', 3, 8, 2)
+        }
+        G1 = ZXGraph([0, 1, 2], [(0, 1), (1, 2)], dict(labels))
+        G2 = ZXGraph([2, 0, 1], [(1, 2), (0, 1)], dict(labels))
+        assert G1.fingerprint == G2.fingerprint
+        assert graphs_equal(G1, G2)
+        
+        # In-place change is picked up without a resync
+        G2.labels[2] = NodeLabel('Z', 1, 8, 2)
+        assert G1.fingerprint != G2.fingerprint
+        assert not graphs_equal(G1, G2)
+    
+    def test_graphs_equal_after_in_place_edits(self):
+        """Cached fingerprints never outlive an edit to either graph"""
+        G = ZXGraph([0, 1], [(0, 1)], {
+            0: NodeLabel('Z', 0, 1, 0),
+            1: NodeLabel('X', 1, 2, 1)
+        })
+        H = G.copy()
+        assert graphs_equal(G, H)
+        
+        H.labels[1] = NodeLabel('Z', 1, 2, 1)
+        assert not graphs_equal(G, H)
+        
+        G.nodes.append(2)
+        G.labels[2] = NodeLabel('Z', 0, 1, 2)
+        assert graphs_equal(G, G.copy())
 
 
 class TestTheoryCompliance:
@@ -215,7 +369,7 @@ class TestTheoryCompliance:
         for D in diagrams:
             D.validate()
     
-    def test_qpi_compliance(self):
+    def test_qpi_compliance(self, label_validation):
         """All phases must have power-of-2 denominators"""
         valid_denoms = [1, 2, 4, 8, 16, 32, 64]
         
@@ -10,11 +10,39 @@ Implements Theory.md Definition 1.1.1-1.1.3:
 Test with: python3 -m pytest sccmu_ui/test_zx_core.py
 """
 
-from dataclasses import dataclass
-from typing import List, Tuple, Dict, Set
+import math
+import os
+import hashlib
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import List, Tuple, Dict, Set, Optional
 import numpy as np
 
-PHI = (1 + np.sqrt(5)) / 2  # Golden ratio from Λ² = Λ + 1
+from . import _zx_numba
+from ._zx_numba import normalize_phase_kernel, add_phases_kernel, validate_soa
+
+try:
+    import xxhash
+    HAVE_XXHASH = True
+except ImportError:
+    # xxhash is optional (falls back to hashlib.blake2b)
+    HAVE_XXHASH = False
+
+PHI = (1 + math.sqrt(5)) / 2  # Golden ratio from Λ² = Λ + 1 (plain float)
+
+# Integer spider codes for array storage (avoids string compares)
+KIND_Z = 0
+KIND_X = 1
+KIND_CODES = {'Z': KIND_Z, 'X': KIND_X}
+
+# Packed per-spider record (13 bytes), see ZXGraph.label_records()
+NODE_LABEL_DTYPE = np.dtype([
+    ('kind', 'u1'), ('numer', 'i4'), ('denom', 'i4'), ('node_id', 'i4')
+], align=False)
+
+# Per-label checks in NodeLabel.__post_init__ (set ZX_VALIDATE=1 to enable).
+# Graphs are always checked in bulk by ZXGraph.validate().
+_ZX_VALIDATE = os.environ.get('ZX_VALIDATE', '0') == '1'
 
 
 @dataclass(frozen=True)
@@ -26,22 +54,57 @@ class NodeLabel:
     phase_numer: Numerator of phase (in units of π)
     phase_denom: Denominator (must be power of 2 for Qπ compliance)
     node_id: Unique identifier
+    
+    Slotted (no per-instance __dict__) to keep large graphs compact.
     """
+    __slots__ = ('kind', 'phase_numer', 'phase_denom', 'node_id')
+    
+    # Every positive int64 power of 2 (denominators come from a tiny set)
+    _POW2 = frozenset(1 << k for k in range(63))
+    
     kind: str  # 'Z' or 'X'
     phase_numer: int
     phase_denom: int
     node_id: int
     
     def __post_init__(self):
-        """Validate on construction"""
-        assert self.kind in ['Z', 'X'], f"kind must be 'Z' or 'X', got {self.kind}"
-        assert self.phase_denom > 0, "phase_denom must be positive"
-        assert self.is_power_of_2(self.phase_denom), f"phase_denom must be power of 2, got {self.phase_denom}"
+        """Validate on construction (only when ZX_VALIDATE=1)"""
+        if __debug__ and _ZX_VALIDATE:
+            assert self.kind in ['Z', 'X'], f"kind must be 'Z' or 'X', got {self.kind}"
+            assert self.phase_denom > 0, "phase_denom must be positive"
+            assert self.is_power_of_2(self.phase_denom), f"phase_denom must be power of 2, got {self.phase_denom}"
+    
+    @classmethod
+    def batch_validate(cls, kinds, numers, denoms) -> None:
+        """
+        Validate many labels at once.
+        
+        kinds: 'Z'/'X' strings or KIND_Z/KIND_X codes
+        numers, denoms: integer phase numerators/denominators
+        """
+        kinds = np.asarray(kinds)
+        denoms = np.asarray(denoms)
+        allowed = ('Z', 'X') if kinds.dtype.kind in 'US' else (KIND_Z, KIND_X)
+        assert np.isin(kinds, allowed).all(), f"kind must be 'Z' or 'X', got {kinds[~np.isin(kinds, allowed)][0]}"
+        assert np.asarray(numers).shape == denoms.shape, "numers and denoms must have the same shape"
+        assert (denoms > 0).all(), "phase_denom must be positive"
+        assert ((denoms & (denoms - 1)) == 0).all(), \
+            f"phase_denom must be power of 2, got {denoms[(denoms & (denoms - 1)) != 0][0]}"
+    
+    def __reduce__(self):
+        """Pickle/copy via the constructor (frozen slots have no __dict__)"""
+        return (type(self), (self.kind, self.phase_numer, self.phase_denom, self.node_id))
+    
+    @classmethod
+    def from_record(cls, record) -> 'NodeLabel':
+        """Build a label from one NODE_LABEL_DTYPE record"""
+        return cls('ZX'[record['kind']], int(record['numer']),
+                   int(record['denom']), int(record['node_id']))
     
     @staticmethod
     def is_power_of_2(n):
         """Check if n is power of 2"""
-        return n > 0 and (n & (n - 1)) == 0
+        return n in NodeLabel._POW2
     
     @property
     def phase_radians(self):
@@ -49,6 +112,38 @@ class NodeLabel:
         return np.pi * self.phase_numer / self.phase_denom
 
 
+class _TrackedList(list):
+    """List that counts in-place mutations (see ZXGraph)"""
+    version = 0
+
+
+class _TrackedDict(dict):
+    """Dict that counts in-place mutations (see ZXGraph)"""
+    version = 0
+
+
+def _counting(base, name):
+    """Wrap base.name so each call bumps the instance's version"""
+    method = getattr(base, name)
+    
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    
+    mutate.__name__ = name
+    mutate.__doc__ = method.__doc__
+    return mutate
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append',
+              'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(_TrackedList, _name, _counting(list, _name))
+for _name in ('__setitem__', '__delitem__', '__ior__', 'pop', 'popitem',
+              'clear', 'update', 'setdefault'):
+    setattr(_TrackedDict, _name, _counting(dict, _name))
+del _name
+
+
 @dataclass
 class ZXGraph:
     """
@@ -57,10 +152,96 @@ class ZXGraph:
     nodes: List of node IDs
     edges: List of (source, target) pairs
     labels: Dict mapping node_id → NodeLabel
+    
+    Labels and edges are also exposed as parallel arrays via `soa`
+    (built lazily). nodes/edges/labels are stored as list/dict
+    subclasses that count in-place mutations, so the arrays are rebuilt
+    on the next read after any change.
     """
     nodes: List[int]
     edges: List[Tuple[int, int]]
     labels: Dict[int, NodeLabel]
+    _soa: Optional[Dict[str, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    _canonical: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _fingerprint: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _cache_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        """Store nodes/edges/labels in mutation-counting containers"""
+        if name in ('nodes', 'edges') and type(value) is not _TrackedList:
+            value = _TrackedList(value)
+        elif name == 'labels' and type(value) is not _TrackedDict:
+            value = _TrackedDict(value)
+        object.__setattr__(self, name, value)
+    
+    def _cache_is_fresh(self) -> bool:
+        """True if the cached views were built from the current contents"""
+        key = self._cache_key
+        return (key is not None
+                and key[0] is self.nodes and key[1] == self.nodes.version
+                and key[2] is self.edges and key[3] == self.edges.version
+                and key[4] is self.labels and key[5] == self.labels.version)
+    
+    def _sync_soa(self) -> Dict[str, np.ndarray]:
+        """
+        Rebuild struct-of-arrays view of labelled nodes and edges.
+        
+        Arrays:
+        - node_id: int32 IDs of labelled nodes (in node order)
+        - kind: int8 spider type (KIND_Z=0, KIND_X=1, -1 if invalid)
+        - phase_numer, phase_denom: int32 phase numerators/denominators
+        - phase_rad: float64 phases in radians (same as NodeLabel.phase_radians)
+        - edge_src, edge_dst: int32 edge endpoints (node IDs)
+        - edges_packed: uint64 (src << 32) | dst, one lane per edge
+        """
+        labeled = [(n, self.labels[n]) for n in self.nodes if n in self.labels]
+        count = len(labeled)
+        # Flatten (src, dst) tuples straight into int32 (no per-row sequence parsing)
+        edges = np.fromiter(
+            chain.from_iterable(self.edges), dtype=np.int32, count=2 * len(self.edges)
+        ).reshape(-1, 2)
+        
+        self._soa = {
+            'node_id': np.fromiter((n for n, _ in labeled), dtype=np.int32, count=count),
+            'kind': np.fromiter((KIND_CODES.get(l.kind, -1) for _, l in labeled), dtype=np.int8, count=count),
+            'phase_numer': np.fromiter((l.phase_numer for _, l in labeled), dtype=np.int32, count=count),
+            'phase_denom': np.fromiter((l.phase_denom for _, l in labeled), dtype=np.int32, count=count),
+            'edge_src': np.ascontiguousarray(edges[:, 0]),
+            'edge_dst': np.ascontiguousarray(edges[:, 1]),
+            'edges_packed': (edges[:, 0].astype(np.uint32).astype(np.uint64) << np.uint64(32))
+                            | edges[:, 1].astype(np.uint32).astype(np.uint64),
+        }
+        self._soa['phase_rad'] = np.pi * self._soa['phase_numer'] / self._soa['phase_denom']
+        self._cache_key = (self.nodes, self.nodes.version, self.edges, self.edges.version,
+                           self.labels, self.labels.version)
+        self._validated = False
+        self._canonical = None
+        self._fingerprint = None
+        return self._soa
+    
+    @property
+    def soa(self) -> Dict[str, np.ndarray]:
+        """Struct-of-arrays view of labels (see `_sync_soa`)"""
+        if not self._cache_is_fresh():
+            return self._sync_soa()
+        return self._soa
+    
+    def label_records(self) -> np.ndarray:
+        """
+        Labels packed into a NODE_LABEL_DTYPE array (in node order).
+        
+        Phases in radians are in `soa['phase_rad']`.
+        """
+        soa = self.soa
+        records = np.empty(soa['node_id'].shape[0], dtype=NODE_LABEL_DTYPE)
+        records['kind'] = soa['kind']
+        records['numer'] = soa['phase_numer']
+        records['denom'] = soa['phase_denom']
+        records['node_id'] = soa['node_id']
+        return records
     
     def validate(self):
         """
@@ -71,30 +252,108 @@ class ZXGraph:
         - All edges reference valid nodes
         - All nodes have labels
         - All phase denominators are powers of 2 (Qπ compliance)
-        """
-        node_set = set(self.nodes)
         
-        # Check edges
-        for u, v in self.edges:
-            assert u != v, f"Self-loop not permitted: {u} -> {u}"
-            assert u in node_set, f"Edge references unknown node: {u}"
-            assert v in node_set, f"Edge references unknown node: {v}"
+        The result is cached with the array view, so re-validating an
+        unchanged graph is free; any edit to nodes, edges or labels
+        discards it.
+        """
+        # Reading soa rebuilds it after an edit, which clears _validated
+        soa = self.soa
+        if self._validated:
+            return True
         
-        # Check labels
-        for node_id in self.nodes:
-            assert node_id in self.labels, f"Node {node_id} has no label"
+        # Check labels (only walk nodes when some label is missing)
+        if soa['node_id'].shape[0] != len(self.nodes):
+            for node_id in self.nodes:
+                assert node_id in self.labels, f"Node {node_id} has no label"
         
-        # NodeLabel validates itself in __post_init__
+        # Edges and labels in one pass (every node is labelled, so
+        # node_id covers all nodes)
+        code, value = validate_soa(
+            np.sort(soa['node_id']), soa['edge_src'], soa['edge_dst'],
+            soa['kind'], soa['phase_denom']
+        )
+        assert code != _zx_numba.SELF_LOOP, f"Self-loop not permitted: {value} -> {value}"
+        assert code != _zx_numba.UNKNOWN_NODE, f"Edge references unknown node: {value}"
+        assert code != _zx_numba.BAD_KIND, f"kind must be 'Z' or 'X', got code {value}"
+        assert code != _zx_numba.BAD_DENOM, (
+            "phase_denom must be positive" if value <= 0
+            else f"phase_denom must be power of 2, got {value}"
+        )
         
+        self._validated = True
         return True
     
+    def _canonical_bytes(self) -> bytes:
+        """
+        Order-independent byte encoding of nodes, labels and edges.
+        
+        Nodes sorted, label columns aligned by node ID, edges as a
+        deduplicated sorted set; a count header keeps sections aligned.
+        Cached with the array view, so it is rebuilt after any edit.
+        """
+        soa = self.soa
+        if self._canonical is not None:
+            return self._canonical
+        
+        nodes = np.sort(np.asarray(self.nodes, dtype=np.int64))
+        order = np.argsort(soa['node_id'], kind='stable')
+        edges = np.unique(soa['edges_packed'])
+        header = np.array([nodes.size, order.size, len(self.edges), edges.size], dtype=np.int64)
+        
+        self._canonical = b''.join((
+            header.tobytes(),
+            nodes.tobytes(),
+            soa['node_id'][order].tobytes(),
+            soa['kind'][order].tobytes(),
+            soa['phase_numer'][order].tobytes(),
+            soa['phase_denom'][order].tobytes(),
+            edges.tobytes(),
+        ))
+        return self._canonical
+    
+    @property
+    def fingerprint(self) -> int:
+        """
+        64-bit hash of the canonical encoding (cached until the graph changes).
+        
+        Equal graphs have equal fingerprints; graphs_equal() uses it to
+        reject unequal pairs without comparing contents.
+        """
+        data = self._canonical_bytes()
+        if self._fingerprint is None:
+            if HAVE_XXHASH:
+                self._fingerprint = xxhash.xxh3_64(data).intdigest()
+            else:
+                self._fingerprint = int.from_bytes(
+                    hashlib.blake2b(data, digest_size=8).digest(), 'little'
+                )
+        return self._fingerprint
+    
+    def canonical_key(self) -> tuple:
+        """
+        Hashable structural key: node list, edge set and labels.
+        
+        Graphs with equal keys are indistinguishable to the coherence
+        function, so the key can stand in for the graph in caches.
+        """
+        return (
+            tuple(self.nodes),
+            tuple(sorted(self.edges)),
+            tuple(sorted(self.labels.items(), key=lambda item: item[0]))
+        )
+    
     def copy(self):
-        """Deep copy of graph"""
-        import copy
+        """
+        Deep copy of graph.
+        
+        NodeLabels are frozen, so copying the labels dict is enough; the
+        labels themselves are shared between copies.
+        """
         return ZXGraph(
-            nodes=copy.copy(self.nodes),
-            edges=copy.copy(self.edges),
-            labels=copy.deepcopy(self.labels)
+            nodes=self.nodes[:],
+            edges=self.edges[:],
+            labels=self.labels.copy()
         )
 
 
@@ -122,22 +381,7 @@ def normalize_phase(phase_numer: int, phase_denom: int) -> Tuple[int, int]:
     Phase = (phase_numer / phase_denom) * π
     Normalize to [0, 2π) range with gcd reduction.
     """
-    from math import gcd
-    
-    # Reduce to [0, 2*denom) range
-    mod = 2 * phase_denom
-    numer_mod = phase_numer % mod
-    
-    # Reduce by GCD
-    g = gcd(abs(numer_mod), phase_denom)
-    if g > 0:
-        numer_reduced = numer_mod // g
-        denom_reduced = phase_denom // g
-    else:
-        numer_reduced = numer_mod
-        denom_reduced = phase_denom
-    
-    return numer_reduced, denom_reduced
+    return normalize_phase_kernel(phase_numer, phase_denom)
 
 
 def add_phases(phase1_n: int, phase1_d: int, 
@@ -147,19 +391,7 @@ def add_phases(phase1_n: int, phase1_d: int,
     
     Theory requirement: Result must have power-of-2 denominator.
     """
-    # Find common denominator (LCM for powers of 2 is max)
-    common_denom = max(phase1_d, phase2_d)
-    
-    # Convert to common denominator
-    numer1 = phase1_n * (common_denom // phase1_d)
-    numer2 = phase2_n * (common_denom // phase2_d)
-    
-    # Add
-    result_numer = numer1 + numer2
-    result_denom = common_denom
-    
-    # Normalize
-    return normalize_phase(result_numer, result_denom)
+    return add_phases_kernel(phase1_n, phase1_d, phase2_n, phase2_d)
 
 
 # Graph equality and hashing for diagram space
@@ -167,24 +399,14 @@ def graphs_equal(G1: ZXGraph, G2: ZXGraph) -> bool:
     """
     Check if two graphs are equal (not just isomorphic).
     
-    For diagram space enumeration.
+    For diagram space enumeration. Cached fingerprints reject unequal
+    graphs in O(1); matching fingerprints are confirmed on the
+    canonical encoding, so hash collisions cannot give false positives.
     """
     if len(G1.nodes) != len(G2.nodes):
         return False
     if len(G1.edges) != len(G2.edges):
         return False
-    
-    # Check node labels
-    for node in G1.nodes:
-        if node not in G2.nodes:
-            return False
-        label1 = G1.labels.get(node)
-        label2 = G2.labels.get(node)
-        if label1 != label2:
-            return False
-    
-    # Check edges (order independent)
-    edges1 = set(G1.edges)
-    edges2 = set(G2.edges)
-    return edges1 == edges2
-
+    if G1.fingerprint != G2.fingerprint:
+        return False
+    return G1._canonical_bytes() == G2._canonical_bytes()
@@ -6,10 +6,24 @@ Systematically verifies every numerical claim in the SCCMU theory.
 Reports discrepancies honestly without fake fallbacks.
 """
 
+import math
 import numpy as np
-from typing import Tuple, Dict
+from dataclasses import dataclass
+from typing import Tuple, Dict, List
 
-PHI = (1 + np.sqrt(5)) / 2
+PHI = (1 + math.sqrt(5.0)) / 2
+
+
+@dataclass
+class FormulaSpec:
+    """One numerical claim: computed value vs claimed and observed values"""
+    name: str
+    formula_str: str
+    computed: float
+    claimed: float
+    observed: float
+    tolerance_percent: float = 1.0
+    critical: bool = True
 
 
 class FormulaAuditor:
@@ -29,37 +43,58 @@ class FormulaAuditor:
         
         Returns: dict with status and analysis
         """
-        error_vs_claimed = abs(computed - claimed) / abs(claimed) * 100 if claimed != 0 else float('inf')
-        error_vs_observed = abs(computed - observed) / abs(observed) * 100 if observed != 0 else float('inf')
+        spec = FormulaSpec(name, formula_str, computed, claimed, observed,
+                           tolerance_percent, critical)
+        return self.check_formulas([spec])[0]
+    
+    def check_formulas(self, specs: List[FormulaSpec]) -> List[Dict]:
+        """
+        Check many formulas at once
         
-        # Determine status
-        if error_vs_claimed < tolerance_percent and error_vs_observed < tolerance_percent:
-            status = '✅ PASS'
-            self.passes += 1
-        elif error_vs_claimed > 50:
-            status = '🔴 CRITICAL' if critical else '🟡 MODERATE'
-            if critical:
-                self.critical_failures += 1
-            else:
-                self.moderate_issues += 1
-        else:
-            status = '🟡 MODERATE'
-            self.moderate_issues += 1
+        Errors and statuses are computed column-wise over all specs.
         
-        result = {
-            'name': name,
-            'formula': formula_str,
-            'computed': computed,
-            'claimed': claimed,
-            'observed': observed,
-            'error_vs_claimed_percent': error_vs_claimed,
-            'error_vs_observed_percent': error_vs_observed,
-            'status': status,
-            'critical': critical
-        }
+        Returns: list of result dicts, in spec order
+        """
+        computed = np.array([s.computed for s in specs], dtype=float)
+        claimed = np.array([s.claimed for s in specs], dtype=float)
+        observed = np.array([s.observed for s in specs], dtype=float)
+        tolerance = np.array([s.tolerance_percent for s in specs], dtype=float)
+        critical = np.array([s.critical for s in specs], dtype=bool)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            error_vs_claimed = np.where(
+                claimed != 0, np.abs(computed - claimed) / np.abs(claimed) * 100, np.inf)
+            error_vs_observed = np.where(
+                observed != 0, np.abs(computed - observed) / np.abs(observed) * 100, np.inf)
         
-        self.results.append(result)
-        return result
+        # Determine status
+        passed = (error_vs_claimed < tolerance) & (error_vs_observed < tolerance)
+        failed_critical = ~passed & (error_vs_claimed > 50) & critical
+        status = np.select([passed, failed_critical], ['✅ PASS', '🔴 CRITICAL'],
+                           default='🟡 MODERATE')
+        
+        self.passes += int(passed.sum())
+        self.critical_failures += int(failed_critical.sum())
+        self.moderate_issues += int((~passed & ~failed_critical).sum())
+        
+        results = [
+            {
+                'name': spec.name,
+                'formula': spec.formula_str,
+                'computed': spec.computed,
+                'claimed': spec.claimed,
+                'observed': spec.observed,
+                'error_vs_claimed_percent': float(err_claimed),
+                'error_vs_observed_percent': float(err_observed),
+                'status': str(spec_status),
+                'critical': spec.critical
+            }
+            for spec, err_claimed, err_observed, spec_status
+            in zip(specs, error_vs_claimed, error_vs_observed, status)
+        ]
+        
+        self.results.extend(results)
+        return results
     
     def print_result(self, result: Dict):
         """Print a single result"""
@@ -83,111 +118,62 @@ class FormulaAuditor:
         print("="*60)
         
         # Test 1: Fine structure constant
-        alpha_inv_computed = 4 * (np.pi**3) / (PHI**11)
-        r = self.check_formula(
-            "Fine Structure Constant",
-            "α^(-1) = 4π³/φ^11",
-            alpha_inv_computed,
-            137.036,
-            137.035999,
-            tolerance_percent=1.0,
-            critical=True
-        )
-        self.print_result(r)
+        alpha_inv_computed = 4 * (math.pi**3) / (PHI**11)
         
         # Test 2: Lepton mass ratio μ/e
         mu_e_computed = PHI**7
-        r = self.check_formula(
-            "Lepton Mass Ratio m_μ/m_e",
-            "φ^7",
-            mu_e_computed,
-            207.0,
-            206.768,
-            tolerance_percent=1.0,
-            critical=True
-        )
-        self.print_result(r)
         
         # Test 3: Lepton mass ratio τ/μ
         tau_mu_computed = PHI**3
-        r = self.check_formula(
-            "Lepton Mass Ratio m_τ/m_μ",
-            "φ^3",
-            tau_mu_computed,
-            16.8,
-            16.817,
-            tolerance_percent=1.0,
-            critical=True
-        )
-        self.print_result(r)
         
         # Test 4: Weinberg angle
         cos2_theta_computed = PHI / (2 - PHI)
-        r = self.check_formula(
-            "Weinberg Angle (tree level)",
-            "cos²θ_W = φ/(2-φ)",
-            cos2_theta_computed,
-            0.8097,
-            0.7764,
-            tolerance_percent=5.0,
-            critical=True
-        )
-        self.print_result(r)
         
         # Test 5: Proton-electron mass ratio
-        mp_me_computed = 32 * (np.pi**5) / (3 * PHI**2)
-        r = self.check_formula(
-            "Proton-Electron Mass Ratio",
-            "32π^5/(3φ²)",
-            mp_me_computed,
-            1836.15,
-            1836.152,
-            tolerance_percent=1.0,
-            critical=False
-        )
-        self.print_result(r)
+        mp_me_computed = 32 * (math.pi**5) / (3 * PHI**2)
         
         # Test 6: Dark energy
         rho_lambda_computed = PHI**(-250)
         rho_observed_planck = 1e-52  # Order of magnitude in Planck units
-        r = self.check_formula(
-            "Dark Energy Density",
-            "φ^(-250)",
-            rho_lambda_computed,
-            1e-52,
-            rho_observed_planck,
-            tolerance_percent=50.0,  # Order of magnitude test
-            critical=False
-        )
-        self.print_result(r)
         
         # Test 7: Strong coupling
-        alpha_s_computed = (PHI**2) / (4 * np.pi)
-        r = self.check_formula(
-            "Strong Coupling α_s(m_Z)",
-            "φ²/(4π)",
-            alpha_s_computed,
-            0.118,
-            0.118,
-            tolerance_percent=5.0,
-            critical=False
-        )
-        self.print_result(r)
+        alpha_s_computed = (PHI**2) / (4 * math.pi)
         
         # Test 8: Higgs mass (tree level)
         lambda_h = 1 / (PHI**3)
         v_higgs = 246  # GeV
-        m_H_computed = np.sqrt(2 * lambda_h) * v_higgs
-        r = self.check_formula(
-            "Higgs Mass (tree level)",
-            "√(2/φ³) × 246 GeV",
-            m_H_computed,
-            169,
-            125,
-            tolerance_percent=10.0,
-            critical=False
-        )
-        self.print_result(r)
+        m_H_computed = math.sqrt(2 * lambda_h) * v_higgs
+        
+        specs = [
+            FormulaSpec("Fine Structure Constant", "α^(-1) = 4π³/φ^11",
+                        alpha_inv_computed, 137.036, 137.035999,
+                        tolerance_percent=1.0, critical=True),
+            FormulaSpec("Lepton Mass Ratio m_μ/m_e", "φ^7",
+                        mu_e_computed, 207.0, 206.768,
+                        tolerance_percent=1.0, critical=True),
+            FormulaSpec("Lepton Mass Ratio m_τ/m_μ", "φ^3",
+                        tau_mu_computed, 16.8, 16.817,
+                        tolerance_percent=1.0, critical=True),
+            FormulaSpec("Weinberg Angle (tree level)", "cos²θ_W = φ/(2-φ)",
+                        cos2_theta_computed, 0.8097, 0.7764,
+                        tolerance_percent=5.0, critical=True),
+            FormulaSpec("Proton-Electron Mass Ratio", "32π^5/(3φ²)",
+                        mp_me_computed, 1836.15, 1836.152,
+                        tolerance_percent=1.0, critical=False),
+            FormulaSpec("Dark Energy Density", "φ^(-250)",
+                        rho_lambda_computed, 1e-52, rho_observed_planck,
+                        tolerance_percent=50.0,  # Order of magnitude test
+                        critical=False),
+            FormulaSpec("Strong Coupling α_s(m_Z)", "φ²/(4π)",
+                        alpha_s_computed, 0.118, 0.118,
+                        tolerance_percent=5.0, critical=False),
+            FormulaSpec("Higgs Mass (tree level)", "√(2/φ³) × 246 GeV",
+                        m_H_computed, 169, 125,
+                        tolerance_percent=10.0, critical=False),
+        ]
+        
+        for r in self.check_formulas(specs):
+            self.print_result(r)
         
         # Print summary
         self.print_summary()
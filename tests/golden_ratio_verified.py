@@ -12,13 +12,21 @@ import pennylane as qml
 
 PHI = (1 + np.sqrt(5)) / 2
 
-# Create device
-dev = qml.device('default.qubit', wires=9)
+# Create device: the C++ lightning simulator when installed
+try:
+    dev = qml.device('lightning.qubit', wires=9)
+except qml.DeviceError:
+    # pennylane-lightning is optional
+    dev = qml.device('default.qubit', wires=9)
 
 # VERIFIED PARAMETERS that produce golden ratio
 AB_COUPLING = 0.556  # Stronger A-B coupling
 BC_COUPLING = 0.456  # Weaker B-C coupling
 
+# CRY angles realising those coupling strengths
+ANGLE_AB = 2.0 * np.arcsin(np.sqrt(AB_COUPLING))
+ANGLE_BC = 2.0 * np.arcsin(np.sqrt(BC_COUPLING))
+
 @qml.qnode(dev)
 def create_golden_ratio_state():
     """
@@ -30,60 +38,33 @@ def create_golden_ratio_state():
     
     # A-B coupling with calibrated strength
     for i in range(3):
-        angle_ab = 2 * np.arcsin(np.sqrt(AB_COUPLING))
-        qml.CRY(angle_ab, wires=[i, i+3])
+        qml.CRY(ANGLE_AB, wires=[i, i+3])
     
     # B-C coupling with calibrated weaker strength
     for i in range(3):
-        angle_bc = 2 * np.arcsin(np.sqrt(BC_COUPLING))
-        qml.CRY(angle_bc, wires=[i+3, i+6])
+        qml.CRY(ANGLE_BC, wires=[i+3, i+6])
     
     return qml.state()
 
-def partial_trace(state_vector, keep_qubits, n_qubits=9):
-    """Compute partial trace to get reduced density matrix"""
-    rho = np.outer(state_vector, np.conj(state_vector))
-    keep = sorted(keep_qubits)
-    n_keep = len(keep)
-    dim_keep = 2**n_keep
-    rho_reduced = np.zeros((dim_keep, dim_keep), dtype=complex)
-    
-    for i in range(dim_keep):
-        for j in range(dim_keep):
-            i_bin = format(i, f'0{n_keep}b')
-            j_bin = format(j, f'0{n_keep}b')
-            
-            for k in range(2**(n_qubits - n_keep)):
-                k_bin = format(k, f'0{n_qubits - n_keep}b')
-                idx_i_list = ['0'] * n_qubits
-                idx_j_list = ['0'] * n_qubits
-                
-                for pos, q in enumerate(keep):
-                    idx_i_list[q] = i_bin[pos]
-                    idx_j_list[q] = j_bin[pos]
-                
-                traced_pos = 0
-                for q in range(n_qubits):
-                    if q not in keep:
-                        idx_i_list[q] = k_bin[traced_pos]
-                        idx_j_list[q] = k_bin[traced_pos]
-                        traced_pos += 1
-                
-                idx_i = int(''.join(idx_i_list), 2)
-                idx_j = int(''.join(idx_j_list), 2)
-                rho_reduced[i, j] += rho[idx_i, idx_j]
+def schmidt_entropy(state_vector, region, n_qubits=9):
+    """
+    Von Neumann entropy of a region of a pure state, via its Schmidt spectrum
     
-    return rho_reduced
-
-def entropy(rho):
-    """Calculate von Neumann entropy"""
-    eigenvalues = np.linalg.eigvalsh(rho)
-    eigenvalues = eigenvalues[eigenvalues > 1e-10]
-    if len(eigenvalues) == 0:
-        return 0.0
-    return -np.sum(eigenvalues * np.log2(eigenvalues))
+    The region's wires are moved to the front and ψ is reshaped to a
+    2^k × 2^(n-k) matrix; its squared singular values are the
+    eigenvalues of ρ_region, so no density matrix is formed.
+    """
+    region = list(region)
+    rest = [q for q in range(n_qubits) if q not in region]
+    psi = np.asarray(state_vector).reshape([2] * n_qubits)
+    M = psi.transpose(region + rest).reshape(2**len(region), -1)
+    schmidt = np.linalg.svd(M, compute_uv=False)**2
+    schmidt = schmidt[schmidt > 1e-10]
+    return float(-(schmidt * np.log2(schmidt)).sum()) if schmidt.size else 0.0
 
-print("""
+def main():
+    """Build the state once and report I(A:B)/I(B:C) against φ"""
+    print("""
 ╔══════════════════════════════════════════════════════════════╗
 ║        VERIFIED GOLDEN RATIO QUANTUM STATE TEST             ║
 ║                                                              ║
@@ -92,58 +73,49 @@ print("""
 ╚══════════════════════════════════════════════════════════════╝
 """)
 
-print("Creating quantum state with golden ratio structure...")
+    print("Creating quantum state with golden ratio structure...")
 
-# Run the test multiple times for statistics
-ratios = []
-for run in range(5):
+    # The circuit is exact (no shots, no noise), so every run would return
+    # the same state: one run gives the ratio and its spread is zero
     state = create_golden_ratio_state()
-    
+
     # Define regions
     region_A = [0, 1, 2]
     region_B = [3, 4, 5]
     region_C = [6, 7, 8]
-    
-    # Get reduced density matrices
-    rho_A = partial_trace(state, region_A)
-    rho_B = partial_trace(state, region_B)
-    rho_C = partial_trace(state, region_C)
-    rho_AB = partial_trace(state, region_A + region_B)
-    rho_BC = partial_trace(state, region_B + region_C)
-    
-    # Calculate entropies
-    S_A = entropy(rho_A)
-    S_B = entropy(rho_B)
-    S_C = entropy(rho_C)
-    S_AB = entropy(rho_AB)
-    S_BC = entropy(rho_BC)
-    
+
+    # Entropies from the Schmidt spectrum of the pure state. A two-region
+    # entropy equals that of its complement, S(AB) = S(C) and S(BC) = S(A),
+    # so the three cuts A|BC, B|AC, C|AB give all five with one SVD each
+    S_A = S_BC = schmidt_entropy(state, region_A)
+    S_B = schmidt_entropy(state, region_B)
+    S_C = S_AB = schmidt_entropy(state, region_C)
+
     # Calculate mutual information
     I_AB = S_A + S_B - S_AB
     I_BC = S_B + S_C - S_BC
-    
+
     # Calculate ratio
     ratio = I_AB / (I_BC + 1e-10)
-    ratios.append(ratio)
-    
-    print(f"Run {run+1}: Ratio = {ratio:.6f}")
-
-# Calculate statistics
-mean_ratio = np.mean(ratios)
-std_ratio = np.std(ratios)
-
-print("\n" + "="*60)
-print("RESULTS")
-print("="*60)
-print(f"Mean Ratio:     {mean_ratio:.6f}")
-print(f"Std Dev:        {std_ratio:.6f}")
-print(f"Golden Ratio φ: {PHI:.6f}")
-print(f"Deviation:      {abs(mean_ratio - PHI):.6f}")
-print(f"Relative Error: {100*abs(mean_ratio - PHI)/PHI:.2f}%")
-
-# Final verdict
-if abs(mean_ratio - PHI) < 0.01:
-    print("""
+    print(f"Ratio = {ratio:.6f} (deterministic state)")
+
+    # Calculate statistics. std = 0 is structural, not measured: with a
+    # single run of an exact circuit there is no spread to observe
+    mean_ratio = ratio
+    std_ratio = 0.0
+
+    print("\n" + "="*60)
+    print("RESULTS")
+    print("="*60)
+    print(f"Mean Ratio:     {mean_ratio:.6f}")
+    print(f"Std Dev:        {std_ratio:.6f} (single exact run, not measured)")
+    print(f"Golden Ratio φ: {PHI:.6f}")
+    print(f"Deviation:      {abs(mean_ratio - PHI):.6f}")
+    print(f"Relative Error: {100*abs(mean_ratio - PHI)/PHI:.2f}%")
+
+    # Final verdict
+    if abs(mean_ratio - PHI) < 0.01:
+        print("""
     ╔══════════════════════════════════════════════════════════╗
     ║                   ✓ CONFIRMED!                          ║
     ║                                                          ║
@@ -158,14 +130,18 @@ if abs(mean_ratio - PHI) < 0.01:
     - The universe may indeed maximize coherence at φ
     - Further tests needed with other quantum systems
     """)
-else:
-    print(f"""
+    else:
+        print(f"""
     Deviation of {abs(mean_ratio - PHI):.6f} from golden ratio.
     Need further optimization.
     """)
 
-print("\nPARAMETERS FOR REPLICATION:")
-print(f"AB coupling strength: {AB_COUPLING}")
-print(f"BC coupling strength: {BC_COUPLING}")
-print(f"State preparation: Variable coupling chain")
-print(f"Key insight: Different coupling strengths create φ ratio")
+    print("\nPARAMETERS FOR REPLICATION:")
+    print(f"AB coupling strength: {AB_COUPLING}")
+    print(f"BC coupling strength: {BC_COUPLING}")
+    print(f"State preparation: Variable coupling chain")
+    print(f"Key insight: Different coupling strengths create φ ratio")
+
+
+if __name__ == "__main__":
+    main()
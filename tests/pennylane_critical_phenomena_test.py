@@ -12,10 +12,12 @@ Leverages PennyLane's quantum circuit capabilities to simulate:
 import pennylane as qml
 import numpy as np
 from typing import List, Tuple, Dict, Optional
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
 from dataclasses import dataclass
 import json
+import functools
 from datetime import datetime
 import os
 import pytest
@@ -30,6 +32,46 @@ PREDICTIONS = {
     'quantum_ising_gap': PHI,  # Energy gap scaling
 }
 
+def z_sign_table(n_qubits: int) -> np.ndarray:
+    """
+    Eigenvalues of Z on every wire for every basis state
+    
+    Entry [s, q] is (-1)^(bit of wire q in s) = ±1, with wire 0 the
+    most significant bit (PennyLane ordering), so ⟨Zq⟩ = |ψ|² @ table[:, q].
+    Stored as float64 so the product with |ψ|² is a plain BLAS call.
+    """
+    idx = np.arange(2**n_qubits)
+    shifts = n_qubits - 1 - np.arange(n_qubits)
+    return (1 - 2 * ((idx[:, None] >> shifts) & 1)).astype(np.float64)
+
+def basis_probabilities(state, n_qubits: int) -> np.ndarray:
+    """
+    Computational-basis probabilities of a state or a batch of states
+    
+    state is either 2^n amplitudes (state-vector devices) or a
+    (2^n, 2^n) density matrix as returned by qml.state() on
+    default.mixed, with optional leading batch axes. For ρ the
+    probabilities are its real diagonal, so ⟨Zᵢ⟩ needs no partial trace
+    on mixed states either. A batch of exactly 2^n state vectors is
+    indistinguishable from ρ, so pass such batches one state at a time.
+    """
+    state = np.asarray(state)
+    dim = 2**n_qubits
+    if state.ndim >= 2 and state.shape[-2:] == (dim, dim):
+        return np.diagonal(state, axis1=-2, axis2=-1).real
+    return np.abs(state)**2
+
+# default.mixed stores 4^n entries; skip it above this size
+MAX_MIXED_QUBITS = 8
+
+# Fastest available state-vector simulator
+try:
+    qml.device('lightning.qubit', wires=1)
+    DEFAULT_DEVICE = 'lightning.qubit'
+except qml.DeviceError:
+    # pennylane-lightning is optional
+    DEFAULT_DEVICE = 'default.qubit'
+
 @dataclass
 class PennyLaneCriticalResult:
     """Results from PennyLane critical phenomena measurement"""
@@ -71,7 +113,7 @@ class PennyLaneTransverseFieldIsing:
     Theory: Critical field h_c/J = 1/φ
     """
     
-    def __init__(self, n_qubits: int = 8, device_name: str = "default.qubit"):
+    def __init__(self, n_qubits: int = 8, device_name: str = DEFAULT_DEVICE):
         """
         Initialize TFIM simulation
         
@@ -82,157 +124,103 @@ class PennyLaneTransverseFieldIsing:
         self.n_qubits = n_qubits
         self.device_name = device_name
         self.device = qml.device(device_name, wires=n_qubits)
+        # Z eigenvalues per basis state and wire, shared by every observable
+        self._z_signs = z_sign_table(n_qubits)
+        # Parametric QNodes, reused for every field value: the full state,
+        # and ⟨Zᵢ⟩ per qubit computed on the device
+        self._circuit = qml.qnode(self.device)(self._tfim_ansatz)
+        self._z_circuit = qml.qnode(self.device)(self._tfim_z_expvals)
+        
+    def _tfim_ansatz(self, h_field: float, J_coupling: float = 1.0):
+        """TFIM ground-state ansatz returning the state (QNode body)"""
+        self._tfim_gates(h_field, J_coupling)
+        return qml.state()
+    
+    def _tfim_z_expvals(self, h_field: float, J_coupling: float = 1.0):
+        """TFIM ground-state ansatz returning ⟨Zᵢ⟩ for every qubit (QNode body)"""
+        self._tfim_gates(h_field, J_coupling)
+        return [qml.expval(qml.PauliZ(i)) for i in range(self.n_qubits)]
+    
+    def _tfim_gates(self, h_field: float, J_coupling: float):
+        """Gate sequence of the TFIM ground-state ansatz"""
+        # Prepare ground state using VQE approach
+        # Start with |+⟩ state (eigenstate of X)
+        for i in range(self.n_qubits):
+            qml.Hadamard(wires=i)
+        
+        # Apply parameterized ansatz for ground state
+        # Layer 1: ZZ interactions
+        for i in range(self.n_qubits - 1):
+            qml.CNOT(wires=[i, i+1])
+            qml.RZ(2 * J_coupling, wires=i+1)
+            qml.CNOT(wires=[i, i+1])
+        
+        # Layer 2: Transverse field (X rotations)
+        for i in range(self.n_qubits):
+            qml.RX(2 * h_field, wires=i)
         
+        # Layer 3: Additional optimization
+        for i in range(self.n_qubits - 1):
+            qml.CNOT(wires=[i, i+1])
+            qml.RY(0.1, wires=i+1)
+            qml.CNOT(wires=[i, i+1])
+    
     def create_tfim_circuit(self, h_field: float, J_coupling: float = 1.0):
         """
         Create TFIM circuit: H = -J Σ Z_i Z_{i+1} - h Σ X_i
         
+        Binds the parameters to the shared QNode built in __init__.
+        
         Args:
             h_field: Transverse field strength
             J_coupling: Ising coupling strength
         """
-        @qml.qnode(self.device)
-        def circuit():
-            # Prepare ground state using VQE approach
-            # Start with |+⟩ state (eigenstate of X)
-            for i in range(self.n_qubits):
-                qml.Hadamard(wires=i)
-            
-            # Apply parameterized ansatz for ground state
-            # Layer 1: ZZ interactions
-            for i in range(self.n_qubits - 1):
-                qml.CNOT(wires=[i, i+1])
-                qml.RZ(2 * J_coupling, wires=i+1)
-                qml.CNOT(wires=[i, i+1])
-            
-            # Layer 2: Transverse field (X rotations)
-            for i in range(self.n_qubits):
-                qml.RX(2 * h_field, wires=i)
-            
-            # Layer 3: Additional optimization
-            for i in range(self.n_qubits - 1):
-                qml.CNOT(wires=[i, i+1])
-                qml.RY(0.1, wires=i+1)
-                qml.CNOT(wires=[i, i+1])
-            
-            return qml.state()
-        
-        return circuit
+        return functools.partial(self._circuit, h_field, J_coupling)
     
     def calculate_magnetization(self, state: np.ndarray) -> float:
         """
         Calculate magnetization ⟨Z⟩ = Σᵢ ⟨Zᵢ⟩
         
         Args:
-            state: Quantum state vector
+            state: Quantum state vector or density matrix, or a batch
+                of them (leading axis)
             
         Returns:
-            Average magnetization
+            Average magnetization (one per state for a batch)
         """
-        # Convert state to density matrix
-        rho = np.outer(state, state.conj())
+        # ⟨Zᵢ⟩ = Σ_s (-1)^{s_i} p_s: one matmul gives every qubit
+        probs = basis_probabilities(state, self.n_qubits)
+        magnetizations = probs @ self._z_signs
         
-        # Calculate expectation value of Z for each qubit
-        magnetizations = []
-        
-        for i in range(self.n_qubits):
-            # Partial trace to get single-qubit density matrix
-            rho_i = self._partial_trace_single_qubit(rho, i)
-            
-            # Calculate ⟨Z⟩ = Tr(ρᵢ Z)
-            Z_matrix = np.array([[1, 0], [0, -1]])
-            magnetization_i = np.real(np.trace(rho_i @ Z_matrix))
-            magnetizations.append(magnetization_i)
-        
-        return np.mean(magnetizations)
-    
-    def _partial_trace_single_qubit(self, rho: np.ndarray, qubit_index: int) -> np.ndarray:
-        """Partial trace to get single-qubit density matrix using correct implementation"""
-        # Use the working implementation from golden_ratio_verified.py
-        # Extract diagonal elements as state vector
-        state_vector = np.sqrt(np.diag(rho))
-        keep_qubits = [qubit_index]
-        n_total = self.n_qubits
-        
-        # Convert to density matrix
-        rho_full = np.outer(state_vector, np.conj(state_vector))
-        keep = sorted(keep_qubits)
-        n_keep = len(keep)
-        dim_keep = 2**n_keep
-        rho_reduced = np.zeros((dim_keep, dim_keep), dtype=complex)
-        
-        for i in range(dim_keep):
-            for j in range(dim_keep):
-                i_bin = format(i, f'0{n_keep}b')
-                j_bin = format(j, f'0{n_keep}b')
-                
-                for k in range(2**(n_total - n_keep)):
-                    k_bin = format(k, f'0{n_total - n_keep}b')
-                    idx_i_list = ['0'] * n_total
-                    idx_j_list = ['0'] * n_total
-                    
-                    for pos, q in enumerate(keep):
-                        idx_i_list[q] = i_bin[pos]
-                        idx_j_list[q] = j_bin[pos]
-                    
-                    traced_pos = 0
-                    for q in range(n_total):
-                        if q not in keep:
-                            idx_i_list[q] = k_bin[traced_pos]
-                            idx_j_list[q] = k_bin[traced_pos]
-                            traced_pos += 1
-                    
-                    idx_i = int(''.join(idx_i_list), 2)
-                    idx_j = int(''.join(idx_j_list), 2)
-                    rho_reduced[i, j] += rho_full[idx_i, idx_j]
-        
-        return rho_reduced
+        magnetization = magnetizations.mean(axis=-1)
+        return magnetization if magnetization.ndim else float(magnetization)
     
     def calculate_correlation_length(self, state: np.ndarray) -> float:
         """
         Calculate correlation length from spin-spin correlations
         
         Args:
-            state: Quantum state vector
+            state: Quantum state vector or density matrix
             
         Returns:
             Correlation length ξ
         """
-        # Convert state to density matrix
-        rho = np.outer(state, state.conj())
-        
-        # Calculate correlation function C(r) = ⟨Z₀ Zᵣ⟩
-        correlations = []
-        
-        for r in range(1, min(5, self.n_qubits)):  # Limit to avoid edge effects
-            # Calculate ⟨Z₀ Zᵣ⟩
-            corr = self._calculate_two_point_correlation(rho, 0, r)
-            correlations.append(corr)
+        # Calculate correlation function C(r) = ⟨Z₀ Zᵣ⟩ for every r at
+        # once: (-1)^{s₀ ⊕ s_r} = Z₀ Zᵣ eigenvalue, summed against |ψ|²
+        max_r = min(5, self.n_qubits) - 1  # Limit to avoid edge effects
+        probs = basis_probabilities(state, self.n_qubits).ravel()
+        signs = self._z_signs
+        correlations = probs @ (signs[:, :1] * signs[:, 1:max_r + 1])
         
         if len(correlations) < 2:
             return 1.0
         
-        # Fit exponential decay: C(r) ~ exp(-r/ξ)
-        try:
-            r_values = np.arange(1, len(correlations) + 1)
-            popt, _ = curve_fit(lambda r, xi: np.exp(-r/xi), 
-                               r_values, np.abs(correlations), p0=[2])
-            return popt[0]
-        except:
-            return 1.0
-    
-    def _calculate_two_point_correlation(self, rho: np.ndarray, i: int, j: int) -> float:
-        """Calculate two-point correlation ⟨Zᵢ Zⱼ⟩"""
-        # Reshape density matrix
-        rho_reshaped = rho.reshape([2]*self.n_qubits + [2]*self.n_qubits)
-        
-        # Calculate expectation value
-        Z_i = np.array([[1, 0], [0, -1]])
-        Z_j = np.array([[1, 0], [0, -1]])
-        
-        # This is a simplified calculation
-        # In practice, would need more sophisticated tensor contraction
-        return 0.5  # Placeholder - would need full implementation
+        # Fit exponential decay: C(r) ~ exp(-r/ξ), i.e. log|C| = -r/ξ, a
+        # line through the origin with closed-form least-squares slope
+        r_values = np.arange(1, len(correlations) + 1)
+        log_c = np.log(np.maximum(np.abs(correlations), 1e-12))
+        slope = np.dot(r_values, log_c) / np.dot(r_values, r_values)
+        return float(-1.0 / slope) if slope < 0 else 1.0
     
     def measure_critical_behavior(self, h_range: Tuple[float, float] = (0.3, 1.0),
                                  n_points: int = 20) -> PennyLaneCriticalResult:
@@ -247,32 +235,27 @@ class PennyLaneTransverseFieldIsing:
             PennyLaneCriticalResult with critical field measurement
         """
         h_values = np.linspace(h_range[0], h_range[1], n_points)
-        magnetizations = []
         
         print(f"\nMeasuring TFIM critical behavior...")
         print("─" * 50)
         
-        for i, h in enumerate(h_values):
-            circuit = self.create_tfim_circuit(h)
-            state = circuit()
-            
-            magnetization = self.calculate_magnetization(state)
-            magnetizations.append(magnetization)
-            
-            if (i + 1) % 5 == 0:
-                print(f"Progress: {i+1}/{n_points} - h = {h:.3f}, M = {magnetization:.3f}")
+        # One broadcast execution over every field value, returning ⟨Zᵢ⟩
+        # directly so no state vector is copied back
+        z_expvals = np.stack(self._z_circuit(h_values, 1.0), axis=-1)
+        magnetizations = np.reshape(z_expvals, (n_points, -1)).mean(axis=1)
         
-        magnetizations = np.array(magnetizations)
+        for i in range(4, n_points, 5):
+            print(f"Progress: {i+1}/{n_points} - h = {h_values[i]:.3f}, "
+                  f"M = {magnetizations[i]:.3f}")
         
         # Find critical field (where magnetization drops to zero)
         # Use simple threshold method
         threshold = 0.1
-        critical_indices = np.where(np.abs(magnetizations) < threshold)[0]
-        
-        if len(critical_indices) > 0:
-            h_critical = h_values[critical_indices[0]]
-        else:
-            h_critical = h_values[np.argmin(np.abs(magnetizations))]
+        abs_magnetizations = np.abs(magnetizations)
+        below = abs_magnetizations < threshold
+        # First field below threshold, else the smallest |M|
+        critical_idx = np.argmax(below) if below.any() else np.argmin(abs_magnetizations)
+        h_critical = h_values[critical_idx]
         
         # Theory prediction
         h_c_theory = PREDICTIONS['tfim_critical_field']
@@ -296,7 +279,7 @@ class PennyLaneQuantumPhaseTransition:
     General quantum phase transition simulator using PennyLane
     """
     
-    def __init__(self, n_qubits: int = 6, device_name: str = "default.qubit"):
+    def __init__(self, n_qubits: int = 6, device_name: str = DEFAULT_DEVICE):
         """
         Initialize quantum phase transition simulation
         
@@ -307,107 +290,77 @@ class PennyLaneQuantumPhaseTransition:
         self.n_qubits = n_qubits
         self.device_name = device_name
         self.device = qml.device(device_name, wires=n_qubits)
+        # Z eigenvalues per basis state and wire, shared by every observable
+        self._z_signs = z_sign_table(n_qubits)
+        # Parametric QNodes, reused for every control parameter: the full
+        # state, and ⟨Zᵢ⟩ per qubit computed on the device
+        self._circuit = qml.qnode(self.device)(self._phase_transition_ansatz)
+        self._z_circuit = qml.qnode(self.device)(self._phase_transition_z_expvals)
+        
+    def _phase_transition_ansatz(self, control_param: float):
+        """Phase transition circuit returning the state (QNode body)"""
+        self._phase_transition_gates(control_param)
+        return qml.state()
+    
+    def _phase_transition_z_expvals(self, control_param: float):
+        """Phase transition circuit returning ⟨Zᵢ⟩ for every qubit (QNode body)"""
+        self._phase_transition_gates(control_param)
+        return [qml.expval(qml.PauliZ(i)) for i in range(self.n_qubits)]
+    
+    def _phase_transition_gates(self, control_param: float):
+        """Gate sequence of the phase transition circuit"""
+        # Initial state preparation
+        for i in range(self.n_qubits):
+            qml.Hadamard(wires=i)
+        
+        # Phase transition dynamics
+        # Parametric evolution that changes with control_param
+        
+        # Layer 1: Entangling operations
+        for i in range(self.n_qubits - 1):
+            qml.CNOT(wires=[i, i+1])
+            qml.RZ(control_param * np.pi, wires=i+1)
         
+        # Layer 2: Local operations
+        for i in range(self.n_qubits):
+            qml.RX(control_param * PHI * np.pi, wires=i)
+            qml.RY((1 - control_param) * PHI * np.pi, wires=i)
+        
+        # Layer 3: Final entangling layer
+        for i in range(self.n_qubits - 1):
+            qml.CNOT(wires=[i, i+1])
+            qml.RZ(control_param * PHI**2 * np.pi, wires=i+1)
+    
     def create_phase_transition_circuit(self, control_param: float):
         """
         Create circuit that undergoes phase transition
         
+        Binds the parameter to the shared QNode built in __init__.
+        
         Args:
             control_param: Control parameter (0 to 1)
         """
-        @qml.qnode(self.device)
-        def circuit():
-            # Initial state preparation
-            for i in range(self.n_qubits):
-                qml.Hadamard(wires=i)
-            
-            # Phase transition dynamics
-            # Parametric evolution that changes with control_param
-            
-            # Layer 1: Entangling operations
-            for i in range(self.n_qubits - 1):
-                qml.CNOT(wires=[i, i+1])
-                qml.RZ(control_param * np.pi, wires=i+1)
-            
-            # Layer 2: Local operations
-            for i in range(self.n_qubits):
-                qml.RX(control_param * PHI * np.pi, wires=i)
-                qml.RY((1 - control_param) * PHI * np.pi, wires=i)
-            
-            # Layer 3: Final entangling layer
-            for i in range(self.n_qubits - 1):
-                qml.CNOT(wires=[i, i+1])
-                qml.RZ(control_param * PHI**2 * np.pi, wires=i+1)
-            
-            return qml.state()
-        
-        return circuit
+        return functools.partial(self._circuit, control_param)
     
     def calculate_order_parameter(self, state: np.ndarray) -> float:
         """
         Calculate order parameter for phase transition
         
         Args:
-            state: Quantum state vector
+            state: Quantum state vector or density matrix, or a batch
+                of them (leading axis)
             
         Returns:
-            Order parameter value
+            Order parameter value (one per state for a batch)
         """
-        # Convert state to density matrix
-        rho = np.outer(state, state.conj())
-        
         # Calculate expectation value of order parameter
-        # Use Z-basis measurement as order parameter
-        order_param = 0.0
+        # Use Z-basis measurement as order parameter: ⟨Zᵢ⟩ for every
+        # qubit in one matmul over the basis probabilities
+        probs = basis_probabilities(state, self.n_qubits)
+        order_param = (probs @ self._z_signs).sum(axis=-1)
         
-        for i in range(self.n_qubits):
-            rho_i = self._partial_trace_single_qubit(rho, i)
-            Z_matrix = np.array([[1, 0], [0, -1]])
-            order_param += np.real(np.trace(rho_i @ Z_matrix))
-        
-        return order_param / self.n_qubits
-    
-    def _partial_trace_single_qubit(self, rho: np.ndarray, qubit_index: int) -> np.ndarray:
-        """Partial trace to get single-qubit density matrix using correct implementation"""
-        # Use the working implementation from golden_ratio_verified.py
-        # Extract diagonal elements as state vector
-        state_vector = np.sqrt(np.diag(rho))
-        keep_qubits = [qubit_index]
-        n_total = self.n_qubits
-        
-        # Convert to density matrix
-        rho_full = np.outer(state_vector, np.conj(state_vector))
-        keep = sorted(keep_qubits)
-        n_keep = len(keep)
-        dim_keep = 2**n_keep
-        rho_reduced = np.zeros((dim_keep, dim_keep), dtype=complex)
-        
-        for i in range(dim_keep):
-            for j in range(dim_keep):
-                i_bin = format(i, f'0{n_keep}b')
-                j_bin = format(j, f'0{n_keep}b')
-                
-                for k in range(2**(n_total - n_keep)):
-                    k_bin = format(k, f'0{n_total - n_keep}b')
-                    idx_i_list = ['0'] * n_total
-                    idx_j_list = ['0'] * n_total
-                    
-                    for pos, q in enumerate(keep):
-                        idx_i_list[q] = i_bin[pos]
-                        idx_j_list[q] = j_bin[pos]
-                    
-                    traced_pos = 0
-                    for q in range(n_total):
-                        if q not in keep:
-                            idx_i_list[q] = k_bin[traced_pos]
-                            idx_j_list[q] = k_bin[traced_pos]
-                            traced_pos += 1
-                    
-                    idx_i = int(''.join(idx_i_list), 2)
-                    idx_j = int(''.join(idx_j_list), 2)
-                    rho_reduced[i, j] += rho_full[idx_i, idx_j]
-        
-        return rho_reduced
+        order_param = order_param / self.n_qubits
+        return order_param if order_param.ndim else float(order_param)
     
     def measure_phase_transition(self, param_range: Tuple[float, float] = (0.0, 1.0),
                                 n_points: int = 30) -> PennyLaneCriticalResult:
@@ -422,23 +375,18 @@ class PennyLaneQuantumPhaseTransition:
             PennyLaneCriticalResult with phase transition data
         """
         param_values = np.linspace(param_range[0], param_range[1], n_points)
-        order_params = []
         
         print(f"\nMeasuring quantum phase transition...")
         print("─" * 50)
         
-        for i, param in enumerate(param_values):
-            circuit = self.create_phase_transition_circuit(param)
-            state = circuit()
-            
-            order_param = self.calculate_order_parameter(state)
-            order_params.append(order_param)
-            
-            if (i + 1) % 10 == 0:
-                print(f"Progress: {i+1}/{n_points} - param = {param:.3f}, "
-                      f"order = {order_param:.3f}")
+        # One broadcast execution over every control parameter, returning
+        # ⟨Zᵢ⟩ directly so no state vector is copied back
+        z_expvals = np.stack(self._z_circuit(param_values), axis=-1)
+        order_params = np.reshape(z_expvals, (n_points, -1)).mean(axis=1)
         
-        order_params = np.array(order_params)
+        for i in range(9, n_points, 10):
+            print(f"Progress: {i+1}/{n_points} - param = {param_values[i]:.3f}, "
+                  f"order = {order_params[i]:.3f}")
         
         # Find critical point (where order parameter changes rapidly)
         # Use gradient-based method
@@ -464,13 +412,16 @@ class PennyLaneQuantumPhaseTransition:
 
 
 def plot_critical_behavior(result: PennyLaneCriticalResult, 
-                          save_path: Optional[str] = None):
+                          save_path: Optional[str] = None,
+                          show: bool = False):
     """
     Plot critical behavior results
     
     Args:
         result: Experimental results
         save_path: Optional path to save figure
+        show: Display the figure with plt.show() before closing it
+              (needs an interactive backend in place of Agg)
     """
     fig, axes = plt.subplots(1, 2, figsize=(15, 6))
     
@@ -515,7 +466,9 @@ def plot_critical_behavior(result: PennyLaneCriticalResult,
     
     if save_path:
         plt.savefig(save_path, dpi=150)
-    plt.show()
+    if show:
+        plt.show()
+    plt.close(fig)
 
 
 @pytest.mark.skipif(os.getenv("FAST_TESTS", "1") == "1", reason="Skipping heavy multi-device test in FAST_TESTS mode")
@@ -526,23 +479,27 @@ def test_multiple_devices():
         "default.mixed",
         "lightning.qubit",
     ]
+    n_qubits = 6
     
     results = {}
     
     for device_name in devices:
+        if device_name == "default.mixed" and n_qubits > MAX_MIXED_QUBITS:
+            continue
+        
         print(f"\n{'='*60}")
         print(f"Testing critical phenomena on device: {device_name}")
         print(f"{'='*60}")
         
         try:
             # Test TFIM
-            tfim = PennyLaneTransverseFieldIsing(n_qubits=6, device_name=device_name)
+            tfim = PennyLaneTransverseFieldIsing(n_qubits=n_qubits, device_name=device_name)
             tfim_result = tfim.measure_critical_behavior(n_points=15)
             results[f"{device_name}_tfim"] = tfim_result
             print(tfim_result.report())
             
             # Test Quantum Phase Transition
-            qpt = PennyLaneQuantumPhaseTransition(n_qubits=6, device_name=device_name)
+            qpt = PennyLaneQuantumPhaseTransition(n_qubits=n_qubits, device_name=device_name)
             qpt_result = qpt.measure_phase_transition(n_points=20)
             results[f"{device_name}_qpt"] = qpt_result
             print(qpt_result.report())